@@ -3,16 +3,24 @@ Encryption service for API keys.
 Uses Fernet (AES-256) to encrypt and decrypt sensitive data.
 """
 
+from functools import lru_cache
+
 from cryptography.fernet import Fernet
 
 from app.core.config import settings
 
 
+@lru_cache(maxsize=1)
+def _fernet_for_key(key: str) -> Fernet:
+    """Build (and cache) the Fernet cipher for a given encryption key."""
+    # Convert the encryption key string to bytes for Fernet
+    return Fernet(key.encode())
+
+
 def _get_fernet() -> Fernet:
     """Get Fernet cipher instance using encryption key from settings."""
-    # Convert the encryption key string to bytes for Fernet
-    key_bytes = settings.ENCRYPTION_KEY.encode()
-    return Fernet(key_bytes)
+    # Keyed on the current setting so a rotated key never reuses a stale cipher
+    return _fernet_for_key(settings.ENCRYPTION_KEY)
 
 
 def encrypt_api_key(api_key: str) -> str:
@@ -1,5 +1,6 @@
 """Background tasks for question generation."""
 
+from collections.abc import Awaitable, Callable
 from contextlib import suppress
 import logging
 from uuid import UUID
@@ -36,14 +37,34 @@ def _extract_error_code(exc: Exception) -> str:
     return "UNEXPECTED_ERROR"
 
 
-async def generate_question_task(operation_id: UUID, session_id: UUID):
+async def generate_question_task(
+    operation_id: UUID,
+    session_id: UUID,
+    status_callback: Callable[[str], Awaitable[None]] | None = None,
+):
     """
     Background task to generate an interview question.
 
     Args:
         operation_id: UUID of the Operation to update
         session_id: UUID of the InterviewSession
+        status_callback: Optional coroutine awaited with the new operation
+            status after each status change is committed
     """
+
+    async def _notify(status: str) -> None:
+        # The status is already committed; a failing observer must not turn it into a failure.
+        if status_callback is None:
+            return
+        try:
+            await status_callback(status)
+        except Exception:
+            logger.warning(
+                "Operation status callback failed",
+                extra={"operation_id": str(operation_id), "status": status},
+                exc_info=True,
+            )
+
     async with AsyncSessionLocal() as db:
         operation: Operation | None = None
         operation_type_value: str = "question_generation"
@@ -61,6 +82,7 @@ async def generate_question_task(operation_id: UUID, session_id: UUID):
             # Update to processing
             operation.status = "processing"
             await db.commit()
+            await _notify("processing")
 
             logger.info(
                 "Question generation started",
@@ -89,6 +111,7 @@ async def generate_question_task(operation_id: UUID, session_id: UUID):
                     {"operation_type": operation_type_value},
                 )
                 await db.commit()
+                await _notify("failed")
                 return
 
             # Generate question
@@ -113,6 +136,7 @@ async def generate_question_task(operation_id: UUID, session_id: UUID):
                 # Surface DB issues early and ensure rollback removes partial state.
                 await db.flush()
                 await db.commit()
+                await _notify("completed")
 
                 await db.refresh(message)
 
@@ -143,6 +167,7 @@ async def generate_question_task(operation_id: UUID, session_id: UUID):
                     {"operation_type": operation_type_value},
                 )
                 await db.commit()
+                await _notify("failed")
                 return
 
         except Exception as e:
@@ -165,5 +190,6 @@ async def generate_question_task(operation_id: UUID, session_id: UUID):
                         {"operation_type": operation_type_value},
                     )
                     await db.commit()
+                    await _notify("failed")
             except Exception as commit_error:
                 logger.error(f"Failed to update operation {operation_id} with error: {commit_error}")
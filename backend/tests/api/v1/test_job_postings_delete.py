@@ -87,7 +87,6 @@ async def test_delete_job_posting_other_user_returns_404(async_client: AsyncClie
     )
     db_session.add(other_user)
     await db_session.commit()
-    await db_session.refresh(other_user)
 
     other_job_posting = JobPosting(
         user_id=other_user.id,
@@ -96,7 +95,6 @@ async def test_delete_job_posting_other_user_returns_404(async_client: AsyncClie
     )
     db_session.add(other_job_posting)
     await db_session.commit()
-    await db_session.refresh(other_job_posting)
 
     # Try to delete other user's job posting
     response = await async_client.delete(
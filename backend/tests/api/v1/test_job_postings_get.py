@@ -68,7 +68,6 @@ async def test_get_job_posting_other_user_returns_404(async_client: AsyncClient,
     )
     db_session.add(other_user)
     await db_session.commit()
-    await db_session.refresh(other_user)
 
     other_job_posting = JobPosting(
         user_id=other_user.id,
@@ -77,7 +76,6 @@ async def test_get_job_posting_other_user_returns_404(async_client: AsyncClient,
     )
     db_session.add(other_job_posting)
     await db_session.commit()
-    await db_session.refresh(other_job_posting)
 
     # Try to get other user's job posting
     response = await async_client.get(
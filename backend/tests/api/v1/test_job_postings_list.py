@@ -90,7 +90,6 @@ async def test_list_job_postings_user_isolation(async_client: AsyncClient, auth_
     )
     db_session.add(other_user)
     await db_session.commit()
-    await db_session.refresh(other_user)
 
     other_job_posting = JobPosting(
         user_id=other_user.id,
@@ -98,7 +98,6 @@ async def test_update_job_posting_other_user_returns_404(async_client: AsyncClie
     )
     db_session.add(other_user)
     await db_session.commit()
-    await db_session.refresh(other_user)
 
     other_job_posting = JobPosting(
         user_id=other_user.id,
@@ -107,7 +106,6 @@ async def test_update_job_posting_other_user_returns_404(async_client: AsyncClie
     )
     db_session.add(other_job_posting)
     await db_session.commit()
-    await db_session.refresh(other_job_posting)
 
     # Try to update other user's job posting
     response = await async_client.put(
@@ -16,7 +16,6 @@ async def test_get_operation_pending(async_client: AsyncClient, db_session: Asyn
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     response = await async_client.get(f"/api/v1/operations/{operation.id}")
 
@@ -34,7 +33,6 @@ async def test_get_operation_processing(async_client: AsyncClient, db_session: A
     operation = Operation(operation_type="question_generation", status="processing")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     response = await async_client.get(f"/api/v1/operations/{operation.id}")
 
@@ -54,7 +52,6 @@ async def test_get_operation_completed_with_result(async_client: AsyncClient, db
     operation = Operation(operation_type="question_generation", status="completed", result=result_data)
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     response = await async_client.get(f"/api/v1/operations/{operation.id}")
 
@@ -75,7 +72,6 @@ async def test_get_operation_failed_with_error(async_client: AsyncClient, db_ses
     )
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     response = await async_client.get(f"/api/v1/operations/{operation.id}")
 
@@ -105,7 +101,6 @@ async def test_polling_pattern_status_updates(async_client: AsyncClient, db_sess
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     # First poll - pending
     response1 = await async_client.get(f"/api/v1/operations/{operation.id}")
@@ -144,7 +139,6 @@ async def test_operation_idempotent_polling(async_client: AsyncClient, db_sessio
     )
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     # Poll multiple times
     responses = []
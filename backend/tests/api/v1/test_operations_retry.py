@@ -24,7 +24,6 @@ async def test_retry_failed_operation_creates_new_operation(
     )
     db_session.add(failed_op)
     await db_session.commit()
-    await db_session.refresh(failed_op)
 
     # Retry the operation
     response = await async_client.post(
@@ -64,7 +63,6 @@ async def test_retry_non_failed_operation_returns_error(
     )
     db_session.add(completed_op)
     await db_session.commit()
-    await db_session.refresh(completed_op)
 
     # Attempt retry
     response = await async_client.post(
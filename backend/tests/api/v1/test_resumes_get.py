@@ -73,7 +73,6 @@ async def test_user_cannot_access_other_users_resume(
     )
     db_session.add(other_user)
     await db_session.commit()
-    await db_session.refresh(other_user)
 
     other_resume = Resume(
         user_id=other_user.id,
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.interview_session import InterviewSession
 from app.models.session_message import SessionMessage
+from tests.conftest import assert_error
 
 
 @pytest.mark.asyncio
@@ -484,10 +485,7 @@ async def test_get_feedback_not_found_no_feedback(
         headers=auth_headers,
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert data["detail"]["code"] == "FEEDBACK_NOT_FOUND"
-    assert "not been generated" in data["detail"]["message"]
+    assert_error(response, 404, "FEEDBACK_NOT_FOUND", message_contains="not been generated")
 
 
 @pytest.mark.asyncio
@@ -503,9 +501,7 @@ async def test_get_feedback_not_found_session(
         headers=auth_headers,
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert data["detail"]["code"] == "SESSION_NOT_FOUND"
+    assert_error(response, 404, "SESSION_NOT_FOUND")
 
 
 @pytest.mark.asyncio
@@ -537,6 +533,4 @@ async def test_get_feedback_wrong_user(
         headers=other_user_auth_headers,
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert data["detail"]["code"] == "SESSION_NOT_FOUND"
+    assert_error(response, 404, "SESSION_NOT_FOUND")
@@ -1,5 +1,6 @@
 """Tests for generate question endpoint."""
 
+import asyncio
 from unittest.mock import patch
 from uuid import UUID, uuid4
 
@@ -9,6 +10,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.operation import Operation
+from tests.conftest import assert_error
 
 
 @pytest.mark.asyncio
@@ -65,7 +67,6 @@ async def test_background_task_completes_successfully(
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     # Run background task
     await generate_question_task(operation.id, test_active_session["id"])
@@ -95,7 +96,6 @@ async def test_background_task_handles_session_not_found(
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     # Run task with non-existent session
     fake_session_id = uuid4()
@@ -131,7 +131,6 @@ async def test_background_task_handles_generation_error(
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     # Run background task
     await generate_question_task(operation.id, test_active_session["id"])
@@ -158,10 +157,7 @@ async def test_generate_question_inactive_session(
         headers=auth_headers,
     )
 
-    assert response.status_code == 400
-    data = response.json()
-    assert "SESSION_NOT_ACTIVE" in data["detail"]["code"]
-    assert "completed" in data["detail"]["message"]
+    assert_error(response, 400, "SESSION_NOT_ACTIVE", message_contains="completed")
 
 
 @pytest.mark.asyncio
@@ -176,9 +172,7 @@ async def test_generate_question_paused_session(
         headers=auth_headers,
     )
 
-    assert response.status_code == 400
-    data = response.json()
-    assert "SESSION_NOT_ACTIVE" in data["detail"]["code"]
+    assert_error(response, 400, "SESSION_NOT_ACTIVE")
 
 
 @pytest.mark.asyncio
@@ -191,9 +185,7 @@ async def test_generate_question_not_found(async_client: AsyncClient, auth_heade
         headers=auth_headers,
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert "SESSION_NOT_FOUND" in data["detail"]["code"]
+    assert_error(response, 404, "SESSION_NOT_FOUND")
 
 
 @pytest.mark.asyncio
@@ -208,9 +200,7 @@ async def test_generate_question_unauthorized_session(
         headers=auth_headers,
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert "SESSION_NOT_FOUND" in data["detail"]["code"]
+    assert_error(response, 404, "SESSION_NOT_FOUND")
 
 
 @pytest.mark.asyncio
@@ -224,7 +214,11 @@ async def test_generate_question_unauthenticated(async_client: AsyncClient):
 
 
 @pytest.mark.asyncio
+@patch("app.tasks.question_tasks.AsyncSessionLocal")
+@patch("app.tasks.question_tasks.generate_question")
 async def test_generate_question_updates_operation_to_processing(
+    mock_generate,
+    mock_session_local,
     async_client: AsyncClient,
     auth_headers: dict,
     test_active_session: dict,
@@ -233,28 +227,67 @@ async def test_generate_question_updates_operation_to_processing(
     """Test background task updates operation to processing status."""
     from app.tasks.question_tasks import generate_question_task
 
+    mock_session_local.return_value.__aenter__.return_value = db_session
+    mock_generate.return_value = {
+        "question_text": "Test question?",
+        "question_type": "technical",
+    }
+
     # Create operation
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
-    # Mock generate_question to pause and check status
-    with patch("app.tasks.question_tasks.generate_question") as mock_generate:
-        # Setup mock that allows us to check operation mid-execution
-        async def check_processing(*args, **kwargs):
-            # At this point, operation should be 'processing'
-            await db_session.refresh(operation)
-            assert operation.status == "processing"
-            return {
-                "question_text": "Test question?",
-                "question_type": "technical",
-            }
-
-        mock_generate.side_effect = check_processing
-
-        # Run task
-        await generate_question_task(operation.id, test_active_session["id"])
+    # Record status transitions in-process instead of re-reading the operation
+    statuses: asyncio.Queue[str] = asyncio.Queue()
+
+    async def record_status(status: str) -> None:
+        await statuses.put(status)
+
+    await generate_question_task(
+        operation.id,
+        test_active_session["id"],
+        status_callback=record_status,
+    )
+
+    assert await asyncio.wait_for(statuses.get(), 1.0) == "processing"
+    assert await asyncio.wait_for(statuses.get(), 1.0) == "completed"
+
+
+@pytest.mark.asyncio
+@patch("app.tasks.question_tasks.AsyncSessionLocal")
+@patch("app.tasks.question_tasks.generate_question")
+async def test_generate_question_status_callback_error_keeps_operation_completed(
+    mock_generate,
+    mock_session_local,
+    test_active_session: dict,
+    db_session: AsyncSession,
+):
+    """Test a failing status callback does not mark a successful operation as failed."""
+    from app.tasks.question_tasks import generate_question_task
+
+    mock_session_local.return_value.__aenter__.return_value = db_session
+    mock_generate.return_value = {
+        "question_text": "Test question?",
+        "question_type": "technical",
+    }
+
+    operation = Operation(operation_type="question_generation", status="pending")
+    db_session.add(operation)
+    await db_session.commit()
+
+    async def failing_callback(status: str) -> None:
+        raise RuntimeError(f"observer failed on {status}")
+
+    await generate_question_task(
+        operation.id,
+        test_active_session["id"],
+        status_callback=failing_callback,
+    )
+
+    await db_session.refresh(operation, ["status", "error_message"])
+    assert operation.status == "completed"
+    assert operation.error_message is None
 
 
 @pytest.mark.asyncio
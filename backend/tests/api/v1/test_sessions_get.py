@@ -7,6 +7,8 @@ import uuid
 from httpx import AsyncClient
 import pytest
 
+from tests.conftest import assert_error
+
 
 @pytest.mark.asyncio
 async def test_get_session_detail_success(
@@ -128,10 +130,7 @@ async def test_get_session_detail_not_found_returns_404(async_client: AsyncClien
         headers=auth_headers,
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert "detail" in data
-    assert data["detail"]["code"] == "SESSION_NOT_FOUND"
+    assert_error(response, 404, "SESSION_NOT_FOUND")
 
 
 @pytest.mark.asyncio
@@ -146,10 +145,7 @@ async def test_get_session_detail_other_user_returns_404(
         headers=auth_headers,
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert "detail" in data
-    assert data["detail"]["code"] == "SESSION_NOT_FOUND"
+    assert_error(response, 404, "SESSION_NOT_FOUND")
 
 
 @pytest.mark.asyncio
@@ -5,6 +5,8 @@ import uuid
 from httpx import AsyncClient
 import pytest
 
+from tests.conftest import assert_error
+
 
 @pytest.mark.asyncio
 async def test_get_messages_success(
@@ -71,8 +73,7 @@ async def test_get_messages_not_found(
         headers=auth_headers,
     )
 
-    assert response.status_code == 404
-    assert response.json()["detail"]["code"] == "SESSION_NOT_FOUND"
+    assert_error(response, 404, "SESSION_NOT_FOUND")
 
 
 @pytest.mark.asyncio
@@ -5,6 +5,8 @@ Tests for GET /api/v1/sessions endpoint (list sessions).
 from httpx import AsyncClient
 import pytest
 
+from tests.conftest import assert_error
+
 
 @pytest.mark.asyncio
 async def test_list_sessions_success(async_client: AsyncClient, auth_headers: dict, test_sessions: list):
@@ -77,10 +79,7 @@ async def test_list_sessions_with_invalid_status_returns_400(async_client: Async
         headers=auth_headers,
     )
 
-    assert response.status_code == 400
-    data = response.json()
-    assert "detail" in data
-    assert data["detail"]["code"] == "INVALID_STATUS_FILTER"
+    assert_error(response, 400, "INVALID_STATUS_FILTER")
 
 
 @pytest.mark.asyncio
@@ -7,6 +7,8 @@ import uuid
 from httpx import AsyncClient
 import pytest
 
+from tests.conftest import assert_error
+
 
 @pytest.mark.asyncio
 async def test_create_session_success(async_client: AsyncClient, auth_headers: dict, test_job_posting):
@@ -49,10 +51,7 @@ async def test_create_session_nonexistent_job_posting_returns_404(async_client:
         headers=auth_headers,
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert "detail" in data
-    assert data["detail"]["code"] == "JOB_POSTING_NOT_FOUND"
+    assert_error(response, 404, "JOB_POSTING_NOT_FOUND")
 
 
 @pytest.mark.asyncio
@@ -70,10 +69,7 @@ async def test_create_session_other_users_job_posting_returns_404(
         headers=auth_headers,
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert "detail" in data
-    assert data["detail"]["code"] == "JOB_POSTING_NOT_FOUND"
+    assert_error(response, 404, "JOB_POSTING_NOT_FOUND")
 
 
 @pytest.mark.asyncio
@@ -6,17 +6,19 @@ import uuid
 
 from httpx import AsyncClient
 import pytest
+from sqlalchemy import insert, select, update
+
+from app.models.interview_session import InterviewSession
+from tests.conftest import assert_error
+
+pytestmark = pytest.mark.xdist_group(name="retake")
 
 
 @pytest.mark.asyncio
 async def test_create_retake_success_first_retake(
-    async_client: AsyncClient, auth_headers: dict, test_session_completed, db_session
+    async_client: AsyncClient, auth_headers: dict, test_session_completed
 ):
     """Test creating first retake from original session."""
-    from sqlalchemy import select
-
-    from app.models.interview_session import InterviewSession
-
     response = await async_client.post(
         f"/api/v1/sessions/{test_session_completed.id}/retake",
         headers=auth_headers,
@@ -33,25 +35,12 @@ async def test_create_retake_success_first_retake(
     assert data["current_question_number"] == 0
     assert data["job_posting_id"] == str(test_session_completed.job_posting_id)
 
-    # Verify in database
-    result = await db_session.execute(select(InterviewSession).where(InterviewSession.id == data["id"]))
-    new_session = result.scalar_one_or_none()
-
-    assert new_session is not None
-    assert new_session.retake_number == 2
-    assert new_session.original_session_id == test_session_completed.id
-    assert new_session.status == "active"
-
 
 @pytest.mark.asyncio
 async def test_create_retake_success_second_retake(
     async_client: AsyncClient, auth_headers: dict, test_session_completed, db_session
 ):
     """Test creating second retake - should chain to original."""
-    from sqlalchemy import select
-
-    from app.models.interview_session import InterviewSession
-
     # Create first retake
     first_retake_response = await async_client.post(
         f"/api/v1/sessions/{test_session_completed.id}/retake",
@@ -61,10 +50,10 @@ async def test_create_retake_success_second_retake(
     first_retake_id = first_retake_response.json()["id"]
 
     # Mark first retake as completed
-    result = await db_session.execute(select(InterviewSession).where(InterviewSession.id == first_retake_id))
-    first_retake = result.scalar_one()
-    first_retake.status = "completed"
-    await db_session.commit()
+    await db_session.execute(
+        update(InterviewSession).where(InterviewSession.id == uuid.UUID(first_retake_id)).values(status="completed")
+    )
+    await db_session.flush()
 
     # Create second retake from first retake
     second_retake_response = await async_client.post(
@@ -86,34 +75,40 @@ async def test_create_retake_chain_integrity(
     async_client: AsyncClient, auth_headers: dict, test_session_completed, db_session
 ):
     """Test that retake chain maintains integrity across multiple retakes."""
-    from sqlalchemy import select
-
-    from app.models.interview_session import InterviewSession
-
     original_id = test_session_completed.id
 
-    # Create 3 retakes in sequence
-    previous_id = original_id
-    for expected_retake_num in [2, 3, 4]:
-        # Create retake
-        response = await async_client.post(
-            f"/api/v1/sessions/{previous_id}/retake",
-            headers=auth_headers,
-        )
-        assert response.status_code == 201
-        data = response.json()
-
-        # Verify retake fields
-        assert data["retake_number"] == expected_retake_num
-        assert data["original_session_id"] == str(original_id)
+    # Seed retakes #2 and #3 directly; only the next retake goes through the API
+    latest_id = uuid.uuid4()
+    await db_session.execute(
+        insert(InterviewSession),
+        [
+            {
+                "user_id": test_session_completed.user_id,
+                "job_posting_id": test_session_completed.job_posting_id,
+                "status": "completed",
+                "retake_number": 2,
+                "original_session_id": original_id,
+            },
+            {
+                "id": latest_id,
+                "user_id": test_session_completed.user_id,
+                "job_posting_id": test_session_completed.job_posting_id,
+                "status": "completed",
+                "retake_number": 3,
+                "original_session_id": original_id,
+            },
+        ],
+    )
 
-        # Mark as completed for next iteration
-        result = await db_session.execute(select(InterviewSession).where(InterviewSession.id == data["id"]))
-        retake = result.scalar_one()
-        retake.status = "completed"
-        await db_session.commit()
+    response = await async_client.post(
+        f"/api/v1/sessions/{latest_id}/retake",
+        headers=auth_headers,
+    )
 
-        previous_id = data["id"]
+    assert response.status_code == 201
+    data = response.json()
+    assert data["retake_number"] == 4
+    assert data["original_session_id"] == str(original_id)
 
 
 @pytest.mark.asyncio
@@ -125,24 +120,18 @@ async def test_create_retake_not_completed_returns_400(async_client: AsyncClient
         headers=auth_headers,
     )
 
-    assert response.status_code == 400
-    data = response.json()
-    assert data["detail"]["code"] == "SESSION_NOT_COMPLETED"
-    assert "must be completed" in data["detail"]["message"].lower()
+    assert_error(response, 400, "SESSION_NOT_COMPLETED", message_contains="must be completed")
 
 
 @pytest.mark.asyncio
 async def test_create_retake_nonexistent_session_returns_404(async_client: AsyncClient, auth_headers: dict):
     """Test error when retaking non-existent session."""
-    fake_id = str(uuid.uuid4())
     response = await async_client.post(
-        f"/api/v1/sessions/{fake_id}/retake",
+        f"/api/v1/sessions/{uuid.uuid4()}/retake",
         headers=auth_headers,
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert data["detail"]["code"] == "SESSION_NOT_FOUND"
+    assert_error(response, 404, "SESSION_NOT_FOUND")
 
 
 @pytest.mark.asyncio
@@ -155,9 +144,7 @@ async def test_create_retake_other_users_session_returns_403(
         headers=auth_headers,
     )
 
-    assert response.status_code == 403
-    data = response.json()
-    assert data["detail"]["code"] == "UNAUTHORIZED"
+    assert_error(response, 403, "UNAUTHORIZED")
 
 
 @pytest.mark.asyncio
@@ -167,35 +154,20 @@ async def test_create_retake_unauthenticated_returns_401(async_client: AsyncClie
         f"/api/v1/sessions/{test_session_completed.id}/retake",
     )
 
-    assert response.status_code == 401
+    assert_error(response, 401, "NOT_AUTHENTICATED")
 
 
 @pytest.mark.asyncio
 async def test_create_retake_missing_job_posting_returns_400(
-    async_client: AsyncClient, auth_headers: dict, test_user, db_session
+    async_client: AsyncClient, auth_headers: dict, test_session_missing_jp
 ):
     """Test error when retaking session with deleted job posting."""
-    from app.models.interview_session import InterviewSession
-
-    # Create session without job posting
-    session = InterviewSession(
-        user_id=test_user.id,
-        job_posting_id=None,
-        status="completed",
-        current_question_number=5,
-    )
-    db_session.add(session)
-    await db_session.commit()
-    await db_session.refresh(session)
-
     response = await async_client.post(
-        f"/api/v1/sessions/{session.id}/retake",
+        f"/api/v1/sessions/{test_session_missing_jp.id}/retake",
         headers=auth_headers,
     )
 
-    assert response.status_code == 400
-    data = response.json()
-    assert data["detail"]["code"] == "MISSING_JOB_POSTING"
+    assert_error(response, 400, "MISSING_JOB_POSTING")
 
 
 @pytest.mark.asyncio
@@ -203,10 +175,6 @@ async def test_create_retake_persists_to_database(
     async_client: AsyncClient, auth_headers: dict, test_session_completed, db_session
 ):
     """Test that retake session is properly persisted to database."""
-    from sqlalchemy import select
-
-    from app.models.interview_session import InterviewSession
-
     response = await async_client.post(
         f"/api/v1/sessions/{test_session_completed.id}/retake",
         headers=auth_headers,
@@ -215,8 +183,12 @@ async def test_create_retake_persists_to_database(
     assert response.status_code == 201
     new_session_id = response.json()["id"]
 
-    # Verify in database
-    result = await db_session.execute(select(InterviewSession).where(InterviewSession.id == new_session_id))
+    # Verify in database; populate_existing bypasses the identity map the app shares with the test
+    result = await db_session.execute(
+        select(InterviewSession)
+        .where(InterviewSession.id == uuid.UUID(new_session_id))
+        .execution_options(populate_existing=True)
+    )
     new_session = result.scalar_one_or_none()
 
     assert new_session is not None
@@ -6,6 +6,12 @@ import uuid
 
 from httpx import AsyncClient
 import pytest
+from sqlalchemy import insert
+
+from app.models.interview_session import InterviewSession
+from tests.conftest import assert_error
+
+pytestmark = pytest.mark.xdist_group(name="retake")
 
 
 @pytest.mark.asyncio
@@ -36,26 +42,26 @@ async def test_get_retake_chain_with_retakes(
     db_session,
 ):
     """Test getting retake chain with multiple retakes."""
-    from app.models.interview_session import InterviewSession
-
     # Create two retakes
-    retake1 = InterviewSession(
-        user_id=test_session_completed.user_id,
-        job_posting_id=test_session_completed.job_posting_id,
-        status="completed",
-        retake_number=2,
-        original_session_id=test_session_completed.id,
+    await db_session.execute(
+        insert(InterviewSession),
+        [
+            {
+                "user_id": test_session_completed.user_id,
+                "job_posting_id": test_session_completed.job_posting_id,
+                "status": "completed",
+                "retake_number": 2,
+                "original_session_id": test_session_completed.id,
+            },
+            {
+                "user_id": test_session_completed.user_id,
+                "job_posting_id": test_session_completed.job_posting_id,
+                "status": "active",
+                "retake_number": 3,
+                "original_session_id": test_session_completed.id,
+            },
+        ],
     )
-    retake2 = InterviewSession(
-        user_id=test_session_completed.user_id,
-        job_posting_id=test_session_completed.job_posting_id,
-        status="active",
-        retake_number=3,
-        original_session_id=test_session_completed.id,
-    )
-    db_session.add(retake1)
-    db_session.add(retake2)
-    await db_session.commit()
 
     # Get chain from original session
     response = await async_client.get(
@@ -83,23 +89,25 @@ async def test_get_retake_chain_from_retake_session(
     db_session,
 ):
     """Test getting chain when querying from a retake (not original)."""
-    from app.models.interview_session import InterviewSession
-
     # Create a retake
-    retake = InterviewSession(
-        user_id=test_session_completed.user_id,
-        job_posting_id=test_session_completed.job_posting_id,
-        status="completed",
-        retake_number=2,
-        original_session_id=test_session_completed.id,
+    retake_id = uuid.uuid4()
+    await db_session.execute(
+        insert(InterviewSession),
+        [
+            {
+                "id": retake_id,
+                "user_id": test_session_completed.user_id,
+                "job_posting_id": test_session_completed.job_posting_id,
+                "status": "completed",
+                "retake_number": 2,
+                "original_session_id": test_session_completed.id,
+            },
+        ],
     )
-    db_session.add(retake)
-    await db_session.commit()
-    await db_session.refresh(retake)
 
     # Query from the retake, should still get full chain
     response = await async_client.get(
-        f"/api/v1/sessions/{retake.id}/retake-chain",
+        f"/api/v1/sessions/{retake_id}/retake-chain",
         headers=auth_headers,
     )
 
@@ -108,7 +116,7 @@ async def test_get_retake_chain_from_retake_session(
 
     assert len(data) == 2
     assert data[0]["id"] == str(test_session_completed.id)  # Original comes first
-    assert data[1]["id"] == str(retake.id)
+    assert data[1]["id"] == str(retake_id)
 
 
 @pytest.mark.asyncio
@@ -139,15 +147,12 @@ async def test_get_retake_chain_includes_feedback(
 @pytest.mark.asyncio
 async def test_get_retake_chain_nonexistent_session_returns_404(async_client: AsyncClient, auth_headers: dict):
     """Test error when getting chain for non-existent session."""
-    fake_id = str(uuid.uuid4())
     response = await async_client.get(
-        f"/api/v1/sessions/{fake_id}/retake-chain",
+        f"/api/v1/sessions/{uuid.uuid4()}/retake-chain",
         headers=auth_headers,
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert data["detail"]["code"] == "SESSION_NOT_FOUND"
+    assert_error(response, 404, "SESSION_NOT_FOUND")
 
 
 @pytest.mark.asyncio
@@ -162,9 +167,7 @@ async def test_get_retake_chain_other_users_session_returns_403(
         headers=auth_headers,
     )
 
-    assert response.status_code == 403
-    data = response.json()
-    assert data["detail"]["code"] == "UNAUTHORIZED"
+    assert_error(response, 403, "UNAUTHORIZED")
 
 
 @pytest.mark.asyncio
@@ -185,35 +188,20 @@ async def test_get_retake_chain_ordered_by_retake_number(
     db_session,
 ):
     """Test that sessions are returned in correct order."""
-    from app.models.interview_session import InterviewSession
-
-    # Create retakes in non-sequential order
-    retake3 = InterviewSession(
-        user_id=test_session_completed.user_id,
-        job_posting_id=test_session_completed.job_posting_id,
-        status="active",
-        retake_number=4,
-        original_session_id=test_session_completed.id,
-    )
-    retake1 = InterviewSession(
-        user_id=test_session_completed.user_id,
-        job_posting_id=test_session_completed.job_posting_id,
-        status="completed",
-        retake_number=2,
-        original_session_id=test_session_completed.id,
-    )
-    retake2 = InterviewSession(
-        user_id=test_session_completed.user_id,
-        job_posting_id=test_session_completed.job_posting_id,
-        status="completed",
-        retake_number=3,
-        original_session_id=test_session_completed.id,
+    # Create retakes in scrambled order
+    await db_session.execute(
+        insert(InterviewSession),
+        [
+            {
+                "user_id": test_session_completed.user_id,
+                "job_posting_id": test_session_completed.job_posting_id,
+                "status": status,
+                "retake_number": retake_number,
+                "original_session_id": test_session_completed.id,
+            }
+            for retake_number, status in [(4, "active"), (2, "completed"), (3, "completed")]
+        ],
     )
-    # Add in scrambled order
-    db_session.add(retake3)
-    db_session.add(retake1)
-    db_session.add(retake2)
-    await db_session.commit()
 
     response = await async_client.get(
         f"/api/v1/sessions/{test_session_completed.id}/retake-chain",
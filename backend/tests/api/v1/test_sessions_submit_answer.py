@@ -1,13 +1,24 @@
 """Tests for answer submission endpoint."""
 
+import json
 import uuid
 
 from httpx import AsyncClient
 import pytest
-from sqlalchemy import select
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.session_message import SessionMessage
+from tests.conftest import assert_error
+
+pytestmark = pytest.mark.xdist_group(name="answers")
+
+# Built once and reused so each lookup skips constructing the statement again
+_GET_MESSAGE = lambda_stmt(lambda: select(SessionMessage).where(SessionMessage.id == bindparam("message_id")))
+
+# Long answer (~2000 characters) and its request body, serialized once
+_LONG_ANSWER = "This is a detailed answer. " * 80
+_LONG_ANSWER_JSON = json.dumps({"answer_text": _LONG_ANSWER}).encode()
 
 
 @pytest.mark.asyncio
@@ -38,7 +49,7 @@ async def test_submit_answer_success(
     assert "id" in data
 
     # Verify message stored in database
-    result = await db_session.execute(select(SessionMessage).where(SessionMessage.id == uuid.UUID(data["id"])))
+    result = await db_session.execute(_GET_MESSAGE, {"message_id": uuid.UUID(data["id"])})
     message = result.scalar_one()
     assert message.content == answer_text
     assert message.message_type == "answer"
@@ -51,15 +62,14 @@ async def test_submit_answer_empty_text(
     test_active_session: dict,
 ):
     """Test answer submission with empty text."""
-    session_id = test_active_session["id"]
-
     response = await async_client.post(
-        f"/api/v1/sessions/{session_id}/answers",
+        f"/api/v1/sessions/{test_active_session['id']}/answers",
         headers=auth_headers,
         json={"answer_text": ""},
     )
 
-    assert response.status_code == 422  # Validation error
+    assert response.status_code == 422
+    assert any(error["loc"][-1] == "answer_text" for error in response.json()["detail"])
 
 
 @pytest.mark.asyncio
@@ -69,15 +79,14 @@ async def test_submit_answer_missing_text(
     test_active_session: dict,
 ):
     """Test answer submission without answer_text field."""
-    session_id = test_active_session["id"]
-
     response = await async_client.post(
-        f"/api/v1/sessions/{session_id}/answers",
+        f"/api/v1/sessions/{test_active_session['id']}/answers",
         headers=auth_headers,
         json={},
     )
 
-    assert response.status_code == 422  # Validation error
+    assert response.status_code == 422
+    assert any(error["loc"][-1] == "answer_text" for error in response.json()["detail"])
 
 
 @pytest.mark.asyncio
@@ -87,18 +96,13 @@ async def test_submit_answer_inactive_session(
     test_completed_session: dict,
 ):
     """Test cannot submit answer to completed session."""
-    session_id = test_completed_session["id"]
-
     response = await async_client.post(
-        f"/api/v1/sessions/{session_id}/answers",
+        f"/api/v1/sessions/{test_completed_session['id']}/answers",
         headers=auth_headers,
         json={"answer_text": "Test answer"},
     )
 
-    assert response.status_code == 400
-    data = response.json()
-    assert data["detail"]["code"] == "SESSION_NOT_ACTIVE"
-    assert "Only active sessions accept answers" in data["detail"]["message"]
+    assert_error(response, 400, "SESSION_NOT_ACTIVE", message_contains="Only active sessions accept answers")
 
 
 @pytest.mark.asyncio
@@ -108,17 +112,13 @@ async def test_submit_answer_paused_session(
     test_paused_session: dict,
 ):
     """Test cannot submit answer to paused session."""
-    session_id = test_paused_session["id"]
-
     response = await async_client.post(
-        f"/api/v1/sessions/{session_id}/answers",
+        f"/api/v1/sessions/{test_paused_session['id']}/answers",
         headers=auth_headers,
         json={"answer_text": "Test answer"},
     )
 
-    assert response.status_code == 400
-    data = response.json()
-    assert data["detail"]["code"] == "SESSION_NOT_ACTIVE"
+    assert_error(response, 400, "SESSION_NOT_ACTIVE")
 
 
 @pytest.mark.asyncio
@@ -127,17 +127,13 @@ async def test_submit_answer_not_found(
     auth_headers: dict,
 ):
     """Test submitting answer to non-existent session."""
-    fake_id = uuid.uuid4()
-
     response = await async_client.post(
-        f"/api/v1/sessions/{fake_id}/answers",
+        f"/api/v1/sessions/{uuid.uuid4()}/answers",
         headers=auth_headers,
         json={"answer_text": "Test answer"},
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert data["detail"]["code"] == "SESSION_NOT_FOUND"
+    assert_error(response, 404, "SESSION_NOT_FOUND")
 
 
 @pytest.mark.asyncio
@@ -147,17 +143,13 @@ async def test_submit_answer_unauthorized_session(
     other_user_session: dict,
 ):
     """Test cannot submit answer to another user's session."""
-    session_id = other_user_session["id"]
-
     response = await async_client.post(
-        f"/api/v1/sessions/{session_id}/answers",
+        f"/api/v1/sessions/{other_user_session['id']}/answers",
         headers=auth_headers,
         json={"answer_text": "Test answer"},
     )
 
-    assert response.status_code == 404
-    data = response.json()
-    assert data["detail"]["code"] == "SESSION_NOT_FOUND"
+    assert_error(response, 404, "SESSION_NOT_FOUND")
 
 
 @pytest.mark.asyncio
@@ -166,14 +158,12 @@ async def test_submit_answer_unauthenticated(
     test_active_session: dict,
 ):
     """Test submitting answer without authentication."""
-    session_id = test_active_session["id"]
-
     response = await async_client.post(
-        f"/api/v1/sessions/{session_id}/answers",
+        f"/api/v1/sessions/{test_active_session['id']}/answers",
         json={"answer_text": "Test answer"},
     )
 
-    assert response.status_code == 401
+    assert_error(response, 401, "NOT_AUTHENTICATED")
 
 
 @pytest.mark.asyncio
@@ -222,20 +212,18 @@ async def test_submit_long_answer(
 ):
     """Test submitting a long answer."""
     session_id = test_active_session["id"]
-    # Create a long answer (2000 characters)
-    long_answer = "This is a detailed answer. " * 80
 
     response = await async_client.post(
         f"/api/v1/sessions/{session_id}/answers",
-        headers=auth_headers,
-        json={"answer_text": long_answer},
+        headers={**auth_headers, "Content-Type": "application/json"},
+        content=_LONG_ANSWER_JSON,
     )
 
     assert response.status_code == 201
     data = response.json()
-    assert data["content"] == long_answer
+    assert data["content"] == _LONG_ANSWER
 
     # Verify stored in database
-    result = await db_session.execute(select(SessionMessage).where(SessionMessage.id == uuid.UUID(data["id"])))
+    result = await db_session.execute(_GET_MESSAGE, {"message_id": uuid.UUID(data["id"])})
     message = result.scalar_one()
-    assert message.content == long_answer
+    assert message.content == _LONG_ANSWER
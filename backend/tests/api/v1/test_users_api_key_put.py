@@ -8,35 +8,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.services.encryption_service import decrypt_api_key, encrypt_api_key
+from tests.conftest import walk_json
 
-
-@pytest.mark.asyncio
-async def test_update_api_key_requires_authentication(
-    async_client: AsyncClient,
-) -> None:
-    """Test that PUT /api/v1/users/me/api-key requires authentication."""
-    response = await async_client.put(
-        "/api/v1/users/me/api-key",
-        json={"api_key": "sk-new-test-key"},
-    )
-    assert response.status_code == 401
-    data = response.json()
-    assert data["detail"]["code"] == "NOT_AUTHENTICATED"
-
-
-@pytest.mark.asyncio
-async def test_update_api_key_with_invalid_token_returns_401(
-    async_client: AsyncClient,
-) -> None:
-    """Test that invalid token returns 401."""
-    response = await async_client.put(
-        "/api/v1/users/me/api-key",
-        headers={"Authorization": "Bearer invalid_token"},
-        json={"api_key": "sk-new-test-key"},
-    )
-    assert response.status_code == 401
-    data = response.json()
-    assert data["detail"]["code"] == "INVALID_TOKEN"
+# Encrypted once at import; tests that need a pre-existing key assign this ciphertext.
+_INITIAL_CIPHERTEXT = encrypt_api_key("sk-initial-test-key-1234567890123456789012")
 
 
 @pytest.mark.asyncio
@@ -47,16 +22,9 @@ async def test_update_api_key_overwrites_existing_encrypted_key(
     db_session: AsyncSession,
 ) -> None:
     """Test that updating API key overwrites the existing encrypted key."""
-    # First, set an initial API key
-    initial_key = "sk-initial-test-key-1234567890123456789012"
-    test_user.encrypted_api_key = encrypt_api_key(initial_key)
-    await db_session.commit()
-    await db_session.refresh(test_user)
-
-    # Store the initial encrypted value
-    initial_encrypted = test_user.encrypted_api_key
+    test_user.encrypted_api_key = _INITIAL_CIPHERTEXT
+    await db_session.flush()
 
-    # Now update with a new key
     new_key = "sk-new-updated-key-6789012345678901234567890"
     response = await async_client.put(
         "/api/v1/users/me/api-key",
@@ -70,13 +38,12 @@ async def test_update_api_key_overwrites_existing_encrypted_key(
     assert "successfully" in data["message"].lower() or "updated" in data["message"].lower()
 
     # Verify the encrypted key was overwritten
-    await db_session.refresh(test_user)
+    await db_session.refresh(test_user, ["encrypted_api_key"])
     assert test_user.encrypted_api_key is not None
-    assert test_user.encrypted_api_key != initial_encrypted
+    assert test_user.encrypted_api_key != _INITIAL_CIPHERTEXT
 
     # Verify the new key can be decrypted to the correct value
-    decrypted = decrypt_api_key(test_user.encrypted_api_key)
-    assert decrypted == new_key
+    assert decrypt_api_key(test_user.encrypted_api_key) == new_key
 
 
 @pytest.mark.asyncio
@@ -87,11 +54,9 @@ async def test_update_api_key_response_does_not_contain_api_key(
     db_session: AsyncSession,
 ) -> None:
     """Test that the response never contains the API key."""
-    # Set initial key
-    test_user.encrypted_api_key = encrypt_api_key("sk-initial-key-1234567890123456789012345678")
-    await db_session.commit()
+    test_user.encrypted_api_key = _INITIAL_CIPHERTEXT
+    await db_session.flush()
 
-    # Update with new key
     new_key = "sk-secret-new-key-9999901234567890123456789"
     response = await async_client.put(
         "/api/v1/users/me/api-key",
@@ -103,10 +68,8 @@ async def test_update_api_key_response_does_not_contain_api_key(
     data = response.json()
 
     # Ensure API key is not in response
-    response_str = str(data).lower()
-    assert new_key not in response_str
-    assert "sk-" not in response_str
-    assert "api_key" not in response_str or data.get("api_key") is None
+    assert not any(new_key in text or "sk-" in text.lower() for text in walk_json(data))
+    assert data.get("api_key") is None
 
 
 @pytest.mark.asyncio
@@ -117,13 +80,8 @@ async def test_update_api_key_works_when_no_existing_key(
     db_session: AsyncSession,
 ) -> None:
     """Test that updating works even if user has no existing API key (acts like initial set)."""
-    # Ensure user has no API key
-    test_user.encrypted_api_key = None
-    await db_session.commit()
-    await db_session.refresh(test_user)
     assert test_user.encrypted_api_key is None
 
-    # Update (which is effectively setting for first time)
     new_key = "sk-first-time-key-1111101234567890123456789"
     response = await async_client.put(
         "/api/v1/users/me/api-key",
@@ -134,10 +92,9 @@ async def test_update_api_key_works_when_no_existing_key(
     assert response.status_code == 200
 
     # Verify key was stored
-    await db_session.refresh(test_user)
+    await db_session.refresh(test_user, ["encrypted_api_key"])
     assert test_user.encrypted_api_key is not None
-    decrypted = decrypt_api_key(test_user.encrypted_api_key)
-    assert decrypted == new_key
+    assert decrypt_api_key(test_user.encrypted_api_key) == new_key
 
 
 @pytest.mark.asyncio
@@ -148,9 +105,8 @@ async def test_update_api_key_with_empty_string_fails(
     db_session: AsyncSession,
 ) -> None:
     """Test that empty API key is rejected."""
-    # Set initial key
-    test_user.encrypted_api_key = encrypt_api_key("sk-initial-0123456789012345678901234567890")
-    await db_session.commit()
+    test_user.encrypted_api_key = _INITIAL_CIPHERTEXT
+    await db_session.flush()
 
     # Try to update with empty string
     response = await async_client.put(
@@ -181,7 +137,7 @@ async def test_update_api_key_stores_encrypted_not_plaintext(
     assert response.status_code == 200
 
     # Verify encryption
-    await db_session.refresh(test_user)
+    await db_session.refresh(test_user, ["encrypted_api_key"])
     stored_value = test_user.encrypted_api_key
 
     # Stored value should not be the plaintext
@@ -191,5 +147,4 @@ async def test_update_api_key_stores_encrypted_not_plaintext(
     assert plaintext_key not in stored_value
 
     # But it should decrypt to the plaintext
-    decrypted = decrypt_api_key(stored_value)
-    assert decrypted == plaintext_key
+    assert decrypt_api_key(stored_value) == plaintext_key
@@ -2,7 +2,7 @@
 Tests for API key validation endpoint POST /api/v1/users/me/api-key/validate.
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 from httpx import AsyncClient
 import pytest
@@ -10,33 +10,12 @@ import pytest
 from app.models.user import User
 
 
-@pytest.mark.asyncio
-async def test_validate_api_key_without_authentication_returns_401(
-    async_client: AsyncClient,
-) -> None:
-    """Test that POST /api/v1/users/me/api-key/validate without token returns 401."""
-    response = await async_client.post(
-        "/api/v1/users/me/api-key/validate",
-        json={"api_key": "sk-test123456789012345678901234567890"},
-    )
-
-    assert response.status_code == 401
-    data = response.json()
-    assert data["detail"]["code"] == "NOT_AUTHENTICATED"
-
-
-@pytest.mark.asyncio
-async def test_validate_api_key_with_invalid_token_returns_401(
-    async_client: AsyncClient,
-) -> None:
-    """Test that POST /api/v1/users/me/api-key/validate with invalid token returns 401."""
-    response = await async_client.post(
-        "/api/v1/users/me/api-key/validate",
-        headers={"Authorization": "Bearer invalid_token"},
-        json={"api_key": "sk-test123456789012345678901234567890"},
-    )
-
-    assert response.status_code == 401
+@pytest.fixture
+def mock_openai(patch_constructor) -> AsyncMock:
+    """Patch the endpoint's AsyncOpenAI with one client whose models.list succeeds by default."""
+    mock_client = AsyncMock()
+    mock_client.models.list = AsyncMock(return_value=[])
+    return patch_constructor("app.api.v1.endpoints.users.AsyncOpenAI", mock_client)
 
 
 @pytest.mark.asyncio
@@ -80,96 +59,50 @@ async def test_validate_api_key_too_short_returns_400(
 async def test_validate_api_key_with_valid_key_returns_success(
     async_client: AsyncClient,
     auth_headers: dict[str, str],
+    mock_openai: AsyncMock,
 ) -> None:
     """Test that validation succeeds with valid OpenAI API key."""
-    with patch("app.api.v1.endpoints.users.AsyncOpenAI") as mock_openai:
-        # Mock successful OpenAI API call
-        mock_client = AsyncMock()
-        mock_client.models.list = AsyncMock(return_value=[])
-        mock_openai.return_value = mock_client
-
-        response = await async_client.post(
-            "/api/v1/users/me/api-key/validate",
-            headers=auth_headers,
-            json={"api_key": "sk-proj-test123456789012345678901234567890"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is True
-        assert "valid and working" in data["message"]
-
-
-@pytest.mark.asyncio
-async def test_validate_api_key_with_invalid_openai_key_returns_failure(
-    async_client: AsyncClient,
-    auth_headers: dict[str, str],
-) -> None:
-    """Test that validation fails when OpenAI rejects the API key."""
-    with patch("app.api.v1.endpoints.users.AsyncOpenAI") as mock_openai:
-        # Mock OpenAI 401 error
-        mock_client = AsyncMock()
-        mock_client.models.list = AsyncMock(side_effect=Exception("401 Incorrect API key provided"))
-        mock_openai.return_value = mock_client
-
-        response = await async_client.post(
-            "/api/v1/users/me/api-key/validate",
-            headers=auth_headers,
-            json={"api_key": "sk-proj-invalid123456789012345678901234567890"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is False
-        assert "Invalid API key" in data["message"]
-
-
-@pytest.mark.asyncio
-async def test_validate_api_key_with_rate_limit_error(
-    async_client: AsyncClient,
-    auth_headers: dict[str, str],
-) -> None:
-    """Test that validation handles rate limit errors gracefully."""
-    with patch("app.api.v1.endpoints.users.AsyncOpenAI") as mock_openai:
-        # Mock OpenAI 429 rate limit error
-        mock_client = AsyncMock()
-        mock_client.models.list = AsyncMock(side_effect=Exception("429 Rate limit exceeded"))
-        mock_openai.return_value = mock_client
-
-        response = await async_client.post(
-            "/api/v1/users/me/api-key/validate",
-            headers=auth_headers,
-            json={"api_key": "sk-proj-test123456789012345678901234567890"},
-        )
+    response = await async_client.post(
+        "/api/v1/users/me/api-key/validate",
+        headers=auth_headers,
+        json={"api_key": "sk-proj-test123456789012345678901234567890"},
+    )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is False
-        assert "Rate limit exceeded" in data["message"]
+    assert response.status_code == 200
+    data = response.json()
+    assert data["valid"] is True
+    assert "valid and working" in data["message"]
 
 
 @pytest.mark.asyncio
-async def test_validate_api_key_with_network_error(
+@pytest.mark.parametrize(
+    ("error", "expected_message"),
+    [
+        pytest.param("401 Incorrect API key provided", "Invalid API key", id="invalid_key"),
+        pytest.param("429 Rate limit exceeded", "Rate limit exceeded", id="rate_limit"),
+        pytest.param("Connection timeout", "Could not validate API key", id="network_error"),
+    ],
+)
+async def test_validate_api_key_openai_errors_return_failure(
     async_client: AsyncClient,
     auth_headers: dict[str, str],
+    mock_openai: AsyncMock,
+    error: str,
+    expected_message: str,
 ) -> None:
-    """Test that validation handles network errors gracefully."""
-    with patch("app.api.v1.endpoints.users.AsyncOpenAI") as mock_openai:
-        # Mock network error
-        mock_client = AsyncMock()
-        mock_client.models.list = AsyncMock(side_effect=Exception("Connection timeout"))
-        mock_openai.return_value = mock_client
+    """Test that OpenAI rejections, rate limits and network errors are reported as invalid."""
+    mock_openai.models.list.side_effect = Exception(error)
 
-        response = await async_client.post(
-            "/api/v1/users/me/api-key/validate",
-            headers=auth_headers,
-            json={"api_key": "sk-proj-test123456789012345678901234567890"},
-        )
+    response = await async_client.post(
+        "/api/v1/users/me/api-key/validate",
+        headers=auth_headers,
+        json={"api_key": "sk-proj-test123456789012345678901234567890"},
+    )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is False
-        assert "Could not validate API key" in data["message"]
+    assert response.status_code == 200
+    data = response.json()
+    assert data["valid"] is False
+    assert expected_message in data["message"]
 
 
 @pytest.mark.asyncio
@@ -177,22 +110,18 @@ async def test_validate_api_key_does_not_store_key(
     async_client: AsyncClient,
     auth_headers: dict[str, str],
     test_user: User,
+    mock_openai: AsyncMock,
 ) -> None:
     """Test that validation does not store the API key in the database."""
     original_key = test_user.encrypted_api_key
 
-    with patch("app.api.v1.endpoints.users.AsyncOpenAI") as mock_openai:
-        mock_client = AsyncMock()
-        mock_client.models.list = AsyncMock(return_value=[])
-        mock_openai.return_value = mock_client
-
-        response = await async_client.post(
-            "/api/v1/users/me/api-key/validate",
-            headers=auth_headers,
-            json={"api_key": "sk-proj-test123456789012345678901234567890"},
-        )
+    response = await async_client.post(
+        "/api/v1/users/me/api-key/validate",
+        headers=auth_headers,
+        json={"api_key": "sk-proj-test123456789012345678901234567890"},
+    )
 
-        assert response.status_code == 200
+    assert response.status_code == 200
 
-        # Verify user's API key was not changed
-        assert test_user.encrypted_api_key == original_key
+    # Verify user's API key was not changed
+    assert test_user.encrypted_api_key == original_key
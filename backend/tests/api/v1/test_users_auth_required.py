@@ -0,0 +1,43 @@
+"""
+Authentication checks shared by the /api/v1/users/me endpoints.
+"""
+
+from httpx import AsyncClient
+import pytest
+
+from tests.conftest import assert_error
+
+_ENDPOINTS = [
+    pytest.param("GET", "/api/v1/users/me", None, id="get_profile"),
+    pytest.param("POST", "/api/v1/users/me/api-key", {"api_key": "sk-test123"}, id="set_api_key"),
+    pytest.param("PUT", "/api/v1/users/me/api-key", {"api_key": "sk-new-test-key"}, id="update_api_key"),
+    pytest.param(
+        "POST",
+        "/api/v1/users/me/api-key/validate",
+        {"api_key": "sk-test123456789012345678901234567890"},
+        id="validate_api_key",
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("method", "path", "body"), _ENDPOINTS)
+@pytest.mark.parametrize(
+    ("headers", "code"),
+    [
+        pytest.param({}, "NOT_AUTHENTICATED", id="no_token"),
+        pytest.param({"Authorization": "Bearer invalid_token"}, "INVALID_TOKEN", id="invalid_token"),
+    ],
+)
+async def test_users_me_endpoints_require_valid_token(
+    async_client: AsyncClient,
+    method: str,
+    path: str,
+    body: dict[str, str] | None,
+    headers: dict[str, str],
+    code: str,
+) -> None:
+    """Test that user endpoints reject missing and invalid bearer tokens with 401."""
+    response = await async_client.request(method, path, headers=headers, json=body)
+
+    assert_error(response, 401, code)
@@ -6,31 +6,7 @@ from httpx import AsyncClient
 import pytest
 
 from app.models.user import User
-
-
-@pytest.mark.asyncio
-async def test_get_profile_without_token_returns_401(
-    async_client: AsyncClient,
-) -> None:
-    """Test that GET /api/v1/users/me without token returns 401."""
-    response = await async_client.get("/api/v1/users/me")
-    assert response.status_code == 401
-    data = response.json()
-    assert data["detail"]["code"] == "NOT_AUTHENTICATED"
-
-
-@pytest.mark.asyncio
-async def test_get_profile_with_invalid_token_returns_401(
-    async_client: AsyncClient,
-) -> None:
-    """Test that GET /api/v1/users/me with invalid token returns 401."""
-    response = await async_client.get(
-        "/api/v1/users/me",
-        headers={"Authorization": "Bearer invalid_token"},
-    )
-    assert response.status_code == 401
-    data = response.json()
-    assert data["detail"]["code"] == "INVALID_TOKEN"
+from tests.conftest import cached_hash, walk_json
 
 
 @pytest.mark.asyncio
@@ -68,9 +44,7 @@ async def test_get_profile_does_not_expose_password(
     data = response.json()
 
     # Ensure no password-related fields are in response
-    response_str = str(data).lower()
-    assert "password" not in response_str
-    assert "hash" not in response_str
+    assert not any("password" in text.lower() or "hash" in text.lower() for text in walk_json(data))
 
 
 @pytest.mark.asyncio
@@ -80,16 +54,13 @@ async def test_get_profile_returns_only_authenticated_users_data(
     auth_headers: dict[str, str],
 ) -> None:
     """Test that endpoint returns only the authenticated user's data."""
-    from app.core.security import hash_password
-    from app.models.user import User
-
     # Create another user in the database
     other_user = User(
         email="other@example.com",
-        hashed_password=hash_password("otherpassword123"),
+        hashed_password=cached_hash("otherpassword123"),
     )
     db_session.add(other_user)
-    await db_session.commit()
+    await db_session.flush()
 
     # Request with auth_headers (test_user token)
     response = await async_client.get("/api/v1/users/me", headers=auth_headers)
@@ -3,92 +3,207 @@ Pytest configuration and fixtures for testing.
 """
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+import datetime as dt
+import functools
 import os
+from typing import Any
 import uuid
 
-from httpx import AsyncClient
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
 import pytest
 import pytest_asyncio
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
-    async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 # Ensure security settings are available during tests even if the developer
 # hasn't exported them in the shell running pytest.
 os.environ.setdefault("SECRET_KEY", "test-secret")
 os.environ.setdefault("DB_HOST", "localhost")
-# Generate a valid Fernet key for testing encryption
-from cryptography.fernet import Fernet
+# Generate a valid Fernet key for testing encryption, unless CI already provides one
+if "ENCRYPTION_KEY" not in os.environ:
+    from cryptography.fernet import Fernet
 
-os.environ.setdefault("ENCRYPTION_KEY", Fernet.generate_key().decode())
+    os.environ["ENCRYPTION_KEY"] = Fernet.generate_key().decode()
 
 from app.core.config import settings
 from app.core.database import Base, get_db
-from app.main import app
+from app.core.security import create_access_token, hash_password
+from app.models import InterviewFeedback, InterviewSession, JobPosting, Resume, SessionMessage, User
+from app.services import encryption_service
+
+# The test user's row is rolled back after every test, so one fixed id can be reused
+# and its access token signed once per session.
+TEST_USER_ID = uuid.uuid4()
+
+
+@functools.cache
+def cached_hash(password: str) -> str:
+    """Hash a test password once per run; bcrypt is deliberately slow."""
+    return hash_password(password)
+
+
+def walk_json(obj: Any) -> Iterator[str]:
+    """Yield every key and string value in a decoded JSON document."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            yield key
+            yield from walk_json(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from walk_json(item)
+    elif isinstance(obj, str):
+        yield obj
+
+
+def assert_error(response, status_code: int, code: str, message_contains: str | None = None) -> None:
+    """Assert that a response is an API error with the given status and error code."""
+    assert response.status_code == status_code
+    detail = response.json()["detail"]
+    assert detail["code"] == code
+    if message_contains is not None:
+        assert message_contains in detail["message"]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_encryption() -> None:
+    """Build the cached Fernet cipher once before any test needs it."""
+    encryption_service._get_fernet()
 
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    """
+    Create one event loop shared by every test and async fixture in the session.
+
+    pytest-asyncio 0.21 has no ``loop_scope``, so overriding this fixture is how
+    session-scoped async fixtures (engine, HTTP client) share a loop with tests.
+    """
+    loop = asyncio.new_event_loop()
     yield loop
     loop.close()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--keepdb",
+        action="store_true",
+        default=False,
+        help="Keep the test schema between runs; only create tables when missing and truncate them at exit.",
+    )
+
+
+def _schema_ddl(dialect: sa.Dialect) -> list[str]:
+    """Compile CREATE TABLE / CREATE INDEX statements for every model, in dependency order."""
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)).strip())
+        statements.extend(str(CreateIndex(index).compile(dialect=dialect)) for index in table.indexes)
+    return statements
+
+
+@pytest_asyncio.fixture(scope="session")
+async def engine(request: pytest.FixtureRequest) -> AsyncGenerator[AsyncEngine, None]:
     """
-    Create a test database session.
+    Create the test database engine and schema once per test session.
     Uses test database from environment variables.
+
+    With ``--keepdb`` the schema name is stable per worker and survives the run,
+    so later runs skip the DDL. Drop the schema by hand after changing models.
     """
+    keepdb = request.config.getoption("--keepdb")
     # Use test database URL
     test_database_url = (
         f"postgresql+asyncpg://{settings.DB_USER}:{settings.DB_PASSWORD}"
         f"@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
     )
 
-    schema_name = f"test_{uuid.uuid4().hex}"
+    # One schema per xdist worker (or per plain pytest run) so workers never collide
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    schema_name = f"test_{worker_id}_keepdb" if keepdb else f"test_{worker_id}_{uuid.uuid4().hex}"
 
-    engine = create_async_engine(
+    test_engine = create_async_engine(
         test_database_url,
         echo=False,
-        connect_args={"server_settings": {"search_path": schema_name}},
+        # Durability is pointless for throwaway test data; don't wait on WAL flushes at commit
+        connect_args={"server_settings": {"search_path": schema_name, "synchronous_commit": "off"}},
     )
 
-    # Import models so they're registered with Base.metadata
-    from app.models import interview_feedback as _interview_feedback  # noqa: F401
-    from app.models import interview_session as _interview_session  # noqa: F401
-    from app.models import job_posting as _job_posting  # noqa: F401
-    from app.models import operation as _operation  # noqa: F401
-    from app.models import resume as _resume  # noqa: F401
-    from app.models import session_message as _session_message  # noqa: F401
-    from app.models import user as _user  # noqa: F401
-
-    # Create isolated schema + tables (prevents dropping dev DB objects)
-    async with engine.begin() as conn:
-        await conn.execute(sa.text(f'CREATE SCHEMA IF NOT EXISTS "{schema_name}"'))
-        await conn.execute(sa.text(f'SET search_path TO "{schema_name}"'))
-        await conn.run_sync(Base.metadata.create_all)
+    # Create isolated schema + tables (prevents dropping dev DB objects).
+    # The schema starts empty, so skip create_all's per-table existence checks and
+    # send every CREATE in one simple-query round trip.
+    ddl = ";\n".join([f'CREATE SCHEMA IF NOT EXISTS "{schema_name}"', *_schema_ddl(test_engine.dialect)])
+    async with test_engine.begin() as conn:
+        schema_ready = keepdb and await conn.scalar(sa.text(f"SELECT to_regclass('\"{schema_name}\".users')"))
+        if not schema_ready:
+            raw_connection = await conn.get_raw_connection()
+            await raw_connection.driver_connection.execute(ddl)
 
-    # Create session
-    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    yield test_engine
 
-    async with async_session() as session:
-        yield session
+    async with test_engine.begin() as conn:
+        if keepdb:
+            # Leave the tables in place for the next run; only clear rows committed outside the rollback
+            tables = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
+            await conn.execute(sa.text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+        else:
+            # Cleanup: drop the isolated schema and everything created in it
+            await conn.execute(sa.text(f'DROP SCHEMA IF EXISTS "{schema_name}" CASCADE'))
 
-    # Cleanup: drop the isolated schema and everything created in it
-    async with engine.begin() as conn:
-        await conn.execute(sa.text(f'DROP SCHEMA IF EXISTS "{schema_name}" CASCADE'))
+    await test_engine.dispose()
 
-    await engine.dispose()
+
+@pytest_asyncio.fixture
+async def db_session(engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create a test database session isolated in a transaction.
+
+    The session joins an outer transaction that is rolled back after the test,
+    so commits made by tests or the app only release a SAVEPOINT.
+    """
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """
+    Import the FastAPI application on first use.
+
+    Deferring the import keeps loading this conftest from building the app, so
+    a run limited to modules that never request it (e.g. ``tests/services``)
+    skips route registration. Modules that import ``app.main`` themselves
+    still build it at collection.
+    """
+    from app.main import app as fastapi_app
+    from tests.api.v1.test_auth_dependency import create_test_protected_endpoint
+
+    # Add test protected endpoint for auth dependency testing
+    create_test_protected_endpoint(fastapi_app)
+
+    return fastapi_app
 
 
 @pytest.fixture
-def override_get_db(db_session: AsyncSession):
+def override_get_db(app: FastAPI, db_session: AsyncSession):
     """Override get_db dependency to use test database."""
 
     async def _override_get_db():
@@ -99,16 +214,46 @@ def override_get_db(db_session: AsyncSession):
     app.dependency_overrides.clear()
 
 
-@pytest_asyncio.fixture
-async def async_client(override_get_db) -> AsyncGenerator[AsyncClient, None]:
-    """Create async test HTTP client with database override."""
-    # Add test protected endpoint for auth dependency testing
-    from tests.api.v1.test_auth_dependency import create_test_protected_endpoint
+@pytest_asyncio.fixture(scope="session")
+async def _shared_async_client(app: FastAPI, engine: AsyncEngine) -> AsyncGenerator[AsyncClient, None]:
+    """Create one ASGI transport + async HTTP client reused across the test session."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as test_client:
+        await _warm_routes(app, test_client, engine)
+        yield test_client
 
-    create_test_protected_endpoint(app)
 
-    async with AsyncClient(app=app, base_url="http://test") as test_client:
-        yield test_client
+# Unauthenticated requests are rejected before any query runs; they only prime
+# routing, dependency resolution and response serialization.
+_WARMUP_REQUESTS = [
+    ("GET", "/api/v1/users/me"),
+    ("POST", "/api/v1/users/me/api-key"),
+    ("POST", "/api/v1/users/me/api-key/validate"),
+    ("GET", "/api/v1/sessions"),
+    ("GET", "/api/v1/job-postings/"),
+]
+
+
+async def _warm_routes(app: FastAPI, test_client: AsyncClient, engine: AsyncEngine) -> None:
+    """Issue one request per warm-up path so the first real test doesn't pay cold-start costs."""
+
+    async def _get_db():
+        async with AsyncSession(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = _get_db
+    try:
+        for method, path in _WARMUP_REQUESTS:
+            await test_client.request(method, path)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+@pytest_asyncio.fixture
+async def async_client(
+    app: FastAPI, override_get_db, _shared_async_client: AsyncClient
+) -> AsyncGenerator[AsyncClient, None]:
+    """Provide the shared async test HTTP client with database override."""
+    yield _shared_async_client
 
 
 class _HybridClient:
@@ -119,10 +264,9 @@ class _HybridClient:
     This avoids event loop mismatches with TestClient when using AsyncSession.
     """
 
-    def __init__(self, app, loop: asyncio.AbstractEventLoop, base_url: str = "http://test"):
-        self._app = app
+    def __init__(self, client: AsyncClient, loop: asyncio.AbstractEventLoop):
+        self._client = client
         self._loop = loop
-        self._base_url = base_url
 
     def get(self, *args, **kwargs):
         """Synchronous GET for tests that don't use asyncio.
@@ -130,12 +274,6 @@ class _HybridClient:
         IMPORTANT: Reuse the same event loop that created async fixtures (e.g.
         AsyncSession) to avoid cross-event-loop SQLAlchemy/asyncpg errors.
         """
-        from httpx import AsyncClient
-
-        async def _call():
-            async with AsyncClient(app=self._app, base_url=self._base_url) as ac:
-                return await ac.get(*args, **kwargs)
-
         if self._loop.is_closed():
             raise RuntimeError("Test event loop is closed; cannot run sync HTTP call")
         if self._loop.is_running():
@@ -143,62 +281,65 @@ class _HybridClient:
                 "client.get() cannot run while the loop is running; " "use the 'async_client' fixture instead"
             )
 
-        return self._loop.run_until_complete(_call())
+        return self._loop.run_until_complete(self._client.get(*args, **kwargs))
 
     async def post(self, *args, **kwargs):
-        from httpx import AsyncClient
-
-        async with AsyncClient(app=self._app, base_url=self._base_url) as ac:
-            return await ac.post(*args, **kwargs)
+        return await self._client.post(*args, **kwargs)
 
     async def get_async(self, *args, **kwargs):
-        from httpx import AsyncClient
-
-        async with AsyncClient(app=self._app, base_url=self._base_url) as ac:
-            return await ac.get(*args, **kwargs)
+        return await self._client.get(*args, **kwargs)
 
 
 @pytest.fixture
-def client(override_get_db, event_loop) -> Generator:
+def client(app: FastAPI, override_get_db, _shared_async_client: AsyncClient, event_loop) -> Generator:
     """Provide a hybrid test client compatible with both sync and async tests."""
-    # Add test protected endpoint for auth dependency testing
-    from tests.api.v1.test_auth_dependency import create_test_protected_endpoint
+    yield _HybridClient(_shared_async_client, loop=event_loop)
+
+
+@pytest.fixture
+def patch_constructor(monkeypatch: pytest.MonkeyPatch) -> Callable[[str, Any], Any]:
+    """
+    Return a helper that makes the class at a dotted path construct one given mock.
+
+    Every instantiation during the test returns the same object, so tests can
+    configure and inspect it directly.
+    """
 
-    create_test_protected_endpoint(app)
+    def _patch(target: str, instance: Any) -> Any:
+        monkeypatch.setattr(target, lambda *args, **kwargs: instance)
+        return instance
 
-    yield _HybridClient(app, loop=event_loop)
+    return _patch
 
 
 @pytest_asyncio.fixture
 async def test_user(db_session: AsyncSession):
     """Create a test user in the database."""
-    from app.core.security import hash_password
-    from app.models.user import User
-
     user = User(
+        id=TEST_USER_ID,
         email="test@example.com",
-        hashed_password=hash_password("testpassword123"),
+        hashed_password=cached_hash("testpassword123"),
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
     return user
 
 
+@pytest.fixture(scope="session")
+def _test_user_token() -> str:
+    """Sign the test user's access token once per session."""
+    return create_access_token({"user_id": str(TEST_USER_ID)})
+
+
 @pytest.fixture
-def auth_headers(test_user) -> dict[str, str]:
+def auth_headers(test_user, _test_user_token: str) -> dict[str, str]:
     """Create authentication headers with valid JWT token for test user."""
-    from app.core.security import create_access_token
-
-    token = create_access_token({"user_id": str(test_user.id)})
-    return {"Authorization": f"Bearer {token}"}
+    return {"Authorization": f"Bearer {_test_user_token}"}
 
 
 @pytest_asyncio.fixture
 async def test_job_posting(db_session: AsyncSession, test_user):
     """Create a test job posting for the test user."""
-    from app.models.job_posting import JobPosting
-
     job_posting = JobPosting(
         user_id=test_user.id,
         title="Senior Python Developer",
@@ -209,33 +350,24 @@ async def test_job_posting(db_session: AsyncSession, test_user):
     )
     db_session.add(job_posting)
     await db_session.commit()
-    await db_session.refresh(job_posting)
     return job_posting
 
 
 @pytest_asyncio.fixture
 async def other_user_job_posting(db_session: AsyncSession):
     """Create a job posting owned by another user."""
-    from app.core.security import hash_password
-    from app.models.job_posting import JobPosting
-    from app.models.user import User
-
     other_user = User(
+        id=uuid.uuid4(),
         email="otheruser@example.com",
-        hashed_password=hash_password("password123"),
+        hashed_password=cached_hash("password123"),
     )
-    db_session.add(other_user)
-    await db_session.commit()
-    await db_session.refresh(other_user)
-
     job_posting = JobPosting(
         user_id=other_user.id,
         title="Other User's Job",
         description="Job posting for another user",
     )
-    db_session.add(job_posting)
+    db_session.add_all([other_user, job_posting])
     await db_session.commit()
-    await db_session.refresh(job_posting)
     return {
         "id": job_posting.id,
         "title": job_posting.title,
@@ -246,22 +378,17 @@ async def other_user_job_posting(db_session: AsyncSession):
 @pytest_asyncio.fixture
 async def test_sessions(db_session: AsyncSession, test_user, test_job_posting):
     """Create multiple test sessions with different statuses."""
-    from app.models.interview_session import InterviewSession
-
-    sessions = []
-    for status in ["active", "paused", "completed"]:
-        session = InterviewSession(
+    sessions = [
+        InterviewSession(
             user_id=test_user.id,
             job_posting_id=test_job_posting.id,
             status=status,
             current_question_number=0,
         )
-        db_session.add(session)
-        sessions.append(session)
-
+        for status in ["active", "paused", "completed"]
+    ]
+    db_session.add_all(sessions)
     await db_session.commit()
-    for session in sessions:
-        await db_session.refresh(session)
 
     return [
         {
@@ -276,8 +403,6 @@ async def test_sessions(db_session: AsyncSession, test_user, test_job_posting):
 @pytest_asyncio.fixture
 async def other_user_session(db_session: AsyncSession, other_user_job_posting):
     """Create a session owned by another user."""
-    from app.models.interview_session import InterviewSession
-
     session = InterviewSession(
         user_id=other_user_job_posting["user_id"],
         job_posting_id=other_user_job_posting["id"],
@@ -286,7 +411,6 @@ async def other_user_session(db_session: AsyncSession, other_user_job_posting):
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
     return {
         "id": session.id,
         "user_id": session.user_id,
@@ -296,27 +420,22 @@ async def other_user_session(db_session: AsyncSession, other_user_job_posting):
 @pytest_asyncio.fixture
 async def test_session_with_resume(db_session: AsyncSession, test_user, test_job_posting):
     """Create a test session with user having a resume."""
-    from app.models.interview_session import InterviewSession
-    from app.models.resume import Resume
-
     # Create resume for test user
     resume = Resume(
         user_id=test_user.id,
         content="Test resume content with skills and experience",
     )
-    db_session.add(resume)
-    await db_session.commit()
 
     # Create session
     session = InterviewSession(
+        id=uuid.uuid4(),
         user_id=test_user.id,
         job_posting_id=test_job_posting.id,
         status="active",
         current_question_number=0,
     )
-    db_session.add(session)
+    db_session.add_all([resume, session])
     await db_session.commit()
-    await db_session.refresh(session)
 
     return {
         "id": session.id,
@@ -328,11 +447,9 @@ async def test_session_with_resume(db_session: AsyncSession, test_user, test_job
 @pytest_asyncio.fixture
 async def test_session_no_resume(db_session: AsyncSession, test_user):
     """Create a test session for the authenticated user who has no resume."""
-    from app.models.interview_session import InterviewSession
-    from app.models.job_posting import JobPosting
-
     # Create job posting for the existing test_user (who has no resume here)
     job_posting = JobPosting(
+        id=uuid.uuid4(),
         user_id=test_user.id,
         title="Test Job",
         company="Test Corp",
@@ -340,19 +457,17 @@ async def test_session_no_resume(db_session: AsyncSession, test_user):
         experience_level="Junior",
         tech_stack=["Python"],
     )
-    db_session.add(job_posting)
-    await db_session.commit()
 
     # Create session
     session = InterviewSession(
+        id=uuid.uuid4(),
         user_id=test_user.id,
         job_posting_id=job_posting.id,
         status="active",
         current_question_number=0,
     )
-    db_session.add(session)
+    db_session.add_all([job_posting, session])
     await db_session.commit()
-    await db_session.refresh(session)
 
     return {
         "id": session.id,
@@ -364,8 +479,6 @@ async def test_session_no_resume(db_session: AsyncSession, test_user):
 @pytest_asyncio.fixture
 async def test_active_session(db_session: AsyncSession, test_user, test_job_posting):
     """Create a test session with active status."""
-    from app.models.interview_session import InterviewSession
-
     session = InterviewSession(
         user_id=test_user.id,
         job_posting_id=test_job_posting.id,
@@ -374,7 +487,6 @@ async def test_active_session(db_session: AsyncSession, test_user, test_job_post
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
     return {
         "id": session.id,
         "user_id": session.user_id,
@@ -385,8 +497,6 @@ async def test_active_session(db_session: AsyncSession, test_user, test_job_post
 @pytest_asyncio.fixture
 async def test_completed_session(db_session: AsyncSession, test_user, test_job_posting):
     """Create a test session with completed status."""
-    from app.models.interview_session import InterviewSession
-
     session = InterviewSession(
         user_id=test_user.id,
         job_posting_id=test_job_posting.id,
@@ -395,7 +505,6 @@ async def test_completed_session(db_session: AsyncSession, test_user, test_job_p
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
     return {
         "id": session.id,
         "user_id": session.user_id,
@@ -406,8 +515,6 @@ async def test_completed_session(db_session: AsyncSession, test_user, test_job_p
 @pytest_asyncio.fixture
 async def test_paused_session(db_session: AsyncSession, test_user, test_job_posting):
     """Create a test session with paused status."""
-    from app.models.interview_session import InterviewSession
-
     session = InterviewSession(
         user_id=test_user.id,
         job_posting_id=test_job_posting.id,
@@ -416,7 +523,6 @@ async def test_paused_session(db_session: AsyncSession, test_user, test_job_post
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
     return {
         "id": session.id,
         "user_id": session.user_id,
@@ -427,19 +533,14 @@ async def test_paused_session(db_session: AsyncSession, test_user, test_job_post
 @pytest_asyncio.fixture
 async def test_session_with_messages(db_session: AsyncSession, test_user, test_job_posting):
     """Create a session populated with a question and an answer."""
-    from app.models.interview_session import InterviewSession
-    from app.models.session_message import SessionMessage
-
     # Create session
     session = InterviewSession(
+        id=uuid.uuid4(),
         user_id=test_user.id,
         job_posting_id=test_job_posting.id,
         status="active",
         current_question_number=2,
     )
-    db_session.add(session)
-    await db_session.commit()
-    await db_session.refresh(session)
 
     # Add a question message
     question = SessionMessage(
@@ -448,7 +549,6 @@ async def test_session_with_messages(db_session: AsyncSession, test_user, test_j
         content="What is your experience with Python?",
         question_type="technical",
     )
-    db_session.add(question)
 
     # Add an answer message
     answer = SessionMessage(
@@ -457,8 +557,8 @@ async def test_session_with_messages(db_session: AsyncSession, test_user, test_j
         content="I have 5 years of experience...",
         question_type=None,
     )
-    db_session.add(answer)
 
+    db_session.add_all([session, question, answer])
     await db_session.commit()
 
     return {"id": session.id}
@@ -467,17 +567,13 @@ async def test_session_with_messages(db_session: AsyncSession, test_user, test_j
 @pytest_asyncio.fixture
 async def other_user_auth_headers(db_session: AsyncSession):
     """Create authentication headers for another user."""
-    from app.core.security import create_access_token, hash_password
-    from app.models.user import User
-
     # Create second user
     other_user = User(
         email="otheruser@example.com",
-        hashed_password=hash_password("password123"),
+        hashed_password=cached_hash("password123"),
     )
     db_session.add(other_user)
     await db_session.commit()
-    await db_session.refresh(other_user)
 
     # Create token with correct format
     token = create_access_token({"user_id": str(other_user.id)})
@@ -487,11 +583,6 @@ async def other_user_auth_headers(db_session: AsyncSession):
 @pytest_asyncio.fixture
 async def test_completed_session_with_feedback(db_session: AsyncSession, test_user, test_job_posting):
     """Create a completed session with generated feedback."""
-    import datetime as dt
-
-    from app.models.interview_feedback import InterviewFeedback
-    from app.models.interview_session import InterviewSession
-
     # Create completed session
     session = InterviewSession(
         user_id=test_user.id,
@@ -501,7 +592,6 @@ async def test_completed_session_with_feedback(db_session: AsyncSession, test_us
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
 
     # Create feedback for the session
     feedback = InterviewFeedback(
@@ -526,7 +616,6 @@ async def test_completed_session_with_feedback(db_session: AsyncSession, test_us
     )
     db_session.add(feedback)
     await db_session.commit()
-    await db_session.refresh(feedback)
 
     return {
         "id": session.id,
@@ -539,8 +628,6 @@ async def test_completed_session_with_feedback(db_session: AsyncSession, test_us
 @pytest_asyncio.fixture
 async def test_session(db_session: AsyncSession, test_user, test_job_posting):
     """Create a single active test session."""
-    from app.models.interview_session import InterviewSession
-
     session = InterviewSession(
         user_id=test_user.id,
         job_posting_id=test_job_posting.id,
@@ -549,15 +636,12 @@ async def test_session(db_session: AsyncSession, test_user, test_job_posting):
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
     return session
 
 
 @pytest_asyncio.fixture
 async def test_session_completed(db_session: AsyncSession, test_user, test_job_posting):
     """Create a completed test session for retake tests."""
-    from app.models.interview_session import InterviewSession
-
     session = InterviewSession(
         user_id=test_user.id,
         job_posting_id=test_job_posting.id,
@@ -568,15 +652,12 @@ async def test_session_completed(db_session: AsyncSession, test_user, test_job_p
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
     return session
 
 
 @pytest_asyncio.fixture
 async def other_user_completed_session(db_session: AsyncSession, other_user_job_posting):
     """Create a completed session owned by other_user."""
-    from app.models.interview_session import InterviewSession
-
     session = InterviewSession(
         user_id=other_user_job_posting["user_id"],
         job_posting_id=other_user_job_posting["id"],
@@ -587,9 +668,22 @@ async def other_user_completed_session(db_session: AsyncSession, other_user_job_
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
     return {
         "id": session.id,
         "user_id": session.user_id,
         "status": session.status,
     }
+
+
+@pytest_asyncio.fixture
+async def test_session_missing_jp(db_session: AsyncSession, test_user):
+    """Create a completed session whose job posting no longer exists."""
+    session = InterviewSession(
+        user_id=test_user.id,
+        job_posting_id=None,
+        status="completed",
+        current_question_number=5,
+    )
+    db_session.add(session)
+    await db_session.commit()
+    return session
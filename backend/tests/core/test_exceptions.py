@@ -1,7 +1,5 @@
 """Tests for custom OpenAI integration exceptions."""
 
-import pytest
-
 from app.core.exceptions import (
     AuthenticationError,
     InvalidResponseError,
@@ -12,25 +10,24 @@ from app.core.exceptions import (
     ServerError,
 )
 
+OPENAI_EXCEPTION_CODES = [
+    (NetworkError, "NETWORK_ERROR"),
+    (AuthenticationError, "INVALID_API_KEY"),
+    (RateLimitError, "RATE_LIMIT"),
+    (ServerError, "SERVER_ERROR"),
+    (InvalidResponseError, "INVALID_RESPONSE"),
+    (QuotaExceededError, "QUOTA_EXCEEDED"),
+]
 
-@pytest.mark.parametrize(
-    "exc_cls,code",
-    [
-        (NetworkError, "NETWORK_ERROR"),
-        (AuthenticationError, "INVALID_API_KEY"),
-        (RateLimitError, "RATE_LIMIT"),
-        (ServerError, "SERVER_ERROR"),
-        (InvalidResponseError, "INVALID_RESPONSE"),
-        (QuotaExceededError, "QUOTA_EXCEEDED"),
-    ],
-)
-def test_openai_exceptions_have_error_code_and_message(exc_cls, code):
-    err = exc_cls("hello", error_code=code)
 
-    assert isinstance(err, OpenAIIntegrationError)
-    assert err.message == "hello"
-    assert err.error_code == code
-    assert str(err) == "hello"
+def test_openai_exceptions_have_error_code_and_message():
+    for exc_cls, code in OPENAI_EXCEPTION_CODES:
+        err = exc_cls("hello", error_code=code)
+
+        assert isinstance(err, OpenAIIntegrationError), exc_cls.__name__
+        assert err.message == "hello", exc_cls.__name__
+        assert err.error_code == code, exc_cls.__name__
+        assert str(err) == "hello", exc_cls.__name__
 
 
 def test_openai_exception_can_store_original_error_and_details():
@@ -11,21 +11,34 @@ import pytest
 from app.core.logging_config import JSONFormatter, configure_logging
 
 
+@pytest.fixture
+def make_record():
+    """Factory for LogRecords with optional extra attributes."""
+
+    def _make_record(
+        msg: str = "Test",
+        level: int = logging.INFO,
+        *,
+        pathname: str = "",
+        lineno: int = 0,
+        exc_info=None,
+        **extras,
+    ) -> logging.LogRecord:
+        record = logging.LogRecord("test.logger", level, pathname, lineno, msg, (), exc_info)
+        for key, value in extras.items():
+            setattr(record, key, value)
+        return record
+
+    return _make_record
+
+
 class TestJSONFormatter:
     """Tests for JSON log formatter."""
 
-    def test_basic_log_format(self):
+    def test_basic_log_format(self, make_record):
         """Test that log record is formatted as valid JSON."""
         formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test.logger",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = make_record("Test message")
 
         output = formatter.format(record)
         log_data = json.loads(output)
@@ -35,21 +48,10 @@ class TestJSONFormatter:
         assert log_data["message"] == "Test message"
         assert "timestamp" in log_data
 
-    def test_sensitive_field_masking_in_extra(self):
+    def test_sensitive_field_masking_in_extra(self, make_record):
         """Test that sensitive fields in extra dict are masked."""
         formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test.logger",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Auth attempt",
-            args=(),
-            exc_info=None,
-        )
-        record.password = "secret123"
-        record.api_key = "sk-1234567890"
-        record.user_id = 42
+        record = make_record("Auth attempt", password="secret123", api_key="sk-1234567890", user_id=42)
 
         output = formatter.format(record)
         log_data = json.loads(output)
@@ -58,21 +60,12 @@ class TestJSONFormatter:
         assert log_data["api_key"] == "***MASKED***"
         assert log_data["user_id"] == 42
 
-    def test_sensitive_keyword_in_field_name(self):
+    def test_sensitive_keyword_in_field_name(self, make_record):
         """Test that fields with sensitive keywords in their names are masked."""
         formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test.logger",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Test",
-            args=(),
-            exc_info=None,
+        record = make_record(
+            "Test", user_token="abc123", secret_value="confidential", authorization_header="Bearer xyz"
         )
-        record.user_token = "abc123"
-        record.secret_value = "confidential"
-        record.authorization_header = "Bearer xyz"
 
         output = formatter.format(record)
         log_data = json.loads(output)
@@ -81,18 +74,10 @@ class TestJSONFormatter:
         assert log_data["secret_value"] == "***MASKED***"
         assert log_data["authorization_header"] == "***MASKED***"
 
-    def test_message_masking_with_mask_secrets(self):
+    def test_message_masking_with_mask_secrets(self, make_record):
         """Test that message content is masked using mask_secrets function."""
         formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test.logger",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="API key: sk-1234567890abcdef",
-            args=(),
-            exc_info=None,
-        )
+        record = make_record("API key: sk-1234567890abcdef")
 
         output = formatter.format(record)
         log_data = json.loads(output)
@@ -101,7 +86,7 @@ class TestJSONFormatter:
         assert "sk-1234567890abcdef" not in log_data["message"]
         assert "***MASKED***" in log_data["message"]
 
-    def test_exception_info_included(self):
+    def test_exception_info_included(self, make_record):
         """Test that exception info is included in output."""
         formatter = JSONFormatter()
         try:
@@ -111,15 +96,7 @@ class TestJSONFormatter:
 
             exc_info = sys.exc_info()
 
-        record = logging.LogRecord(
-            name="test.logger",
-            level=logging.ERROR,
-            pathname="",
-            lineno=0,
-            msg="Error occurred",
-            args=(),
-            exc_info=exc_info,
-        )
+        record = make_record("Error occurred", logging.ERROR, exc_info=exc_info)
 
         output = formatter.format(record)
         log_data = json.loads(output)
@@ -128,18 +105,10 @@ class TestJSONFormatter:
         assert "ValueError: Test error" in log_data["exception"]
         assert "Traceback" in log_data["exception"]
 
-    def test_reserved_fields_not_included(self):
+    def test_reserved_fields_not_included(self, make_record):
         """Test that reserved LogRecord fields are not duplicated."""
         formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test.logger",
-            level=logging.INFO,
-            pathname="/path/to/file.py",
-            lineno=42,
-            msg="Test",
-            args=(),
-            exc_info=None,
-        )
+        record = make_record("Test", pathname="/path/to/file.py", lineno=42)
 
         output = formatter.format(record)
         log_data = json.loads(output)
@@ -217,18 +186,10 @@ class TestConfigureLogging:
 class TestSensitiveDataScrubbing:
     """Integration tests for sensitive data scrubbing."""
 
-    def test_nested_dict_scrubbing(self):
+    def test_nested_dict_scrubbing(self, make_record):
         """Test scrubbing in extra dict with structured data."""
         formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test.logger",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Request",
-            args=(),
-            exc_info=None,
-        )
+        record = make_record("Request")
         # If field name contains sensitive keyword, it's masked
         record.api_key = "sk-actual-key"
         record.request_data = "contains some data"
@@ -243,18 +204,10 @@ class TestSensitiveDataScrubbing:
         assert log_data["request_data"] == "contains some data"
         assert log_data["normal_field"] == "safe_value"
 
-    def test_multiple_sensitive_patterns(self):
+    def test_multiple_sensitive_patterns(self, make_record):
         """Test message with multiple sensitive patterns."""
         formatter = JSONFormatter()
-        record = logging.LogRecord(
-            name="test.logger",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Keys: sk-abc123def456 and sk-xyz789ghi012",
-            args=(),
-            exc_info=None,
-        )
+        record = make_record("Keys: sk-abc123def456 and sk-xyz789ghi012")
 
         output = formatter.format(record)
         log_data = json.loads(output)
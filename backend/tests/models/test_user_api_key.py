@@ -6,6 +6,7 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
+from tests.conftest import cached_hash
 
 
 @pytest.mark.asyncio
@@ -13,17 +14,15 @@ async def test_user_model_has_encrypted_api_key_column(
     db_session: AsyncSession,
 ) -> None:
     """Test that User model has encrypted_api_key column by creating a user with it."""
-    from app.core.security import hash_password
-
     # If we can create and query a user with encrypted_api_key, the column exists
     user = User(
         email="test_column_exists@example.com",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=cached_hash("testpass123"),
         encrypted_api_key="test_value",
     )
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
+    await db_session.refresh(user, attribute_names=["encrypted_api_key"])
 
     # Column exists if we can access it
     assert hasattr(user, "encrypted_api_key")
@@ -35,16 +34,14 @@ async def test_encrypted_api_key_field_is_nullable(
     db_session: AsyncSession,
 ) -> None:
     """Test that encrypted_api_key can be null."""
-    from app.core.security import hash_password
-
     # Create user without API key
     user = User(
         email="test_nullable@example.com",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=cached_hash("testpass123"),
     )
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
+    await db_session.refresh(user, attribute_names=["encrypted_api_key"])
 
     # Verify encrypted_api_key is None
     assert user.encrypted_api_key is None
@@ -55,17 +52,15 @@ async def test_encrypted_api_key_can_store_value(
     db_session: AsyncSession,
 ) -> None:
     """Test that encrypted_api_key can store encrypted values."""
-    from app.core.security import hash_password
-
     # Create user with API key
     user = User(
         email="test_with_key@example.com",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=cached_hash("testpass123"),
         encrypted_api_key="encrypted_value_here",
     )
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
+    await db_session.refresh(user, attribute_names=["encrypted_api_key"])
 
     # Verify encrypted_api_key is stored
     assert user.encrypted_api_key == "encrypted_value_here"
@@ -5,7 +5,8 @@ Tests for encryption service.
 from cryptography.fernet import Fernet
 import pytest
 
-from app.services.encryption_service import decrypt_api_key, encrypt_api_key
+from app.core.config import settings
+from app.services.encryption_service import _get_fernet, decrypt_api_key, encrypt_api_key
 
 
 def test_encrypt_api_key_returns_string() -> None:
@@ -44,28 +45,22 @@ def test_encrypting_twice_produces_different_ciphertext() -> None:
     assert decrypt_api_key(encrypted2) == api_key
 
 
-def test_decrypt_with_wrong_key_fails() -> None:
-    """Test that decryption fails with wrong encryption key."""
-    # Generate a different Fernet key
-    wrong_key = Fernet.generate_key().decode()
-
-    # Encrypt with correct key
-    api_key = "sk-test123"
-    encrypted = encrypt_api_key(api_key)
+@pytest.fixture(scope="module")
+def wrong_fernet_key() -> str:
+    """A valid Fernet key that differs from the configured one."""
+    return Fernet.generate_key().decode()
 
-    # Temporarily replace encryption key
-    from app.core.config import settings
 
-    original_key = settings.ENCRYPTION_KEY
+def test_decrypt_with_wrong_key_fails(monkeypatch: pytest.MonkeyPatch, wrong_fernet_key: str) -> None:
+    """Test that decryption fails with wrong encryption key."""
+    # Encrypt with correct key
+    encrypted = encrypt_api_key("sk-test123")
 
-    try:
-        settings.ENCRYPTION_KEY = wrong_key
+    monkeypatch.setattr(settings, "ENCRYPTION_KEY", wrong_fernet_key)
 
-        # Attempt to decrypt with wrong key should fail
-        with pytest.raises(ValueError, match="Decryption failed"):
-            decrypt_api_key(encrypted)
-    finally:
-        settings.ENCRYPTION_KEY = original_key
+    # Attempt to decrypt with wrong key should fail
+    with pytest.raises(ValueError, match="Decryption failed"):
+        decrypt_api_key(encrypted)
 
 
 def test_decrypt_invalid_data_fails() -> None:
@@ -103,3 +98,13 @@ def test_encrypted_key_never_contains_plaintext() -> None:
     # Encrypted version should not contain any part of the plaintext
     assert api_key not in encrypted
     assert "secretkey" not in encrypted
+
+
+def test_fernet_cipher_is_cached_per_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the cipher is reused for the same key and rebuilt when the key changes."""
+    cached = _get_fernet()
+    assert _get_fernet() is cached
+
+    monkeypatch.setattr(settings, "ENCRYPTION_KEY", Fernet.generate_key().decode())
+
+    assert _get_fernet() is not cached
@@ -2,24 +2,32 @@
 Tests for job_posting_service module.
 """
 
+import uuid
+
 import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.services import job_posting_service
 from app.services.job_posting_service import JobPostingNotFoundException
 
 
-@pytest.mark.asyncio
-async def test_create_job_posting_success(db_session):
-    """Test creating job posting with all fields."""
-    user = User(email="user@test.com", hashed_password="hashed")
+@pytest_asyncio.fixture
+async def other_user(db_session: AsyncSession) -> User:
+    """A second user for ownership checks, rolled back with the test."""
+    user = User(email="job-other@test.com", hashed_password="hashed")
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
+    return user
+
 
+@pytest.mark.asyncio
+async def test_create_job_posting_success(db_session, test_user):
+    """Test creating job posting with all fields."""
     job_posting = await job_posting_service.create_job_posting(
         db=db_session,
-        user_id=user.id,
+        user_id=test_user.id,
         title="Senior Python Developer",
         description="Looking for experienced Python developer",
         company="Tech Corp",
@@ -28,7 +36,7 @@ async def test_create_job_posting_success(db_session):
     )
 
     assert job_posting.id is not None
-    assert job_posting.user_id == user.id
+    assert job_posting.user_id == test_user.id
     assert job_posting.title == "Senior Python Developer"
     assert job_posting.description == "Looking for experienced Python developer"
     assert job_posting.company == "Tech Corp"
@@ -37,16 +45,11 @@ async def test_create_job_posting_success(db_session):
 
 
 @pytest.mark.asyncio
-async def test_create_job_posting_only_required_fields(db_session):
+async def test_create_job_posting_only_required_fields(db_session, test_user):
     """Test creating job posting with only required fields."""
-    user = User(email="user2@test.com", hashed_password="hashed")
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
     job_posting = await job_posting_service.create_job_posting(
         db=db_session,
-        user_id=user.id,
+        user_id=test_user.id,
         title="Junior Developer",
         description="Entry level position",
     )
@@ -60,69 +63,54 @@ async def test_create_job_posting_only_required_fields(db_session):
 
 
 @pytest.mark.asyncio
-async def test_get_user_job_postings_returns_list(db_session):
+async def test_get_user_job_postings_returns_list(db_session, test_user):
     """Test get_user_job_postings returns list of postings."""
-    user = User(email="user3@test.com", hashed_password="hashed")
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
     # Create multiple job postings
     await job_posting_service.create_job_posting(
         db=db_session,
-        user_id=user.id,
+        user_id=test_user.id,
         title="Job 1",
         description="Description 1",
     )
     await job_posting_service.create_job_posting(
         db=db_session,
-        user_id=user.id,
+        user_id=test_user.id,
         title="Job 2",
         description="Description 2",
     )
 
-    job_postings = await job_posting_service.get_user_job_postings(db=db_session, user_id=user.id)
+    job_postings = await job_posting_service.get_user_job_postings(db=db_session, user_id=test_user.id)
 
     assert len(job_postings) == 2
     assert job_postings[0].title in ["Job 1", "Job 2"]
 
 
 @pytest.mark.asyncio
-async def test_get_user_job_postings_empty_list(db_session):
+async def test_get_user_job_postings_empty_list(db_session, test_user):
     """Test get_user_job_postings returns empty list when no postings."""
-    user = User(email="user4@test.com", hashed_password="hashed")
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
-    job_postings = await job_posting_service.get_user_job_postings(db=db_session, user_id=user.id)
+    job_postings = await job_posting_service.get_user_job_postings(db=db_session, user_id=test_user.id)
 
     assert job_postings == []
 
 
 @pytest.mark.asyncio
-async def test_get_user_job_postings_ordered_by_created_at_desc(db_session):
+async def test_get_user_job_postings_ordered_by_created_at_desc(db_session, test_user):
     """Test job postings are ordered by created_at descending."""
-    user = User(email="user5@test.com", hashed_password="hashed")
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
     # Create postings in order
     first = await job_posting_service.create_job_posting(
         db=db_session,
-        user_id=user.id,
+        user_id=test_user.id,
         title="First Job",
         description="First",
     )
     second = await job_posting_service.create_job_posting(
         db=db_session,
-        user_id=user.id,
+        user_id=test_user.id,
         title="Second Job",
         description="Second",
     )
 
-    job_postings = await job_posting_service.get_user_job_postings(db=db_session, user_id=user.id)
+    job_postings = await job_posting_service.get_user_job_postings(db=db_session, user_id=test_user.id)
 
     # Most recent should be first
     assert job_postings[0].id == second.id
@@ -130,52 +118,40 @@ async def test_get_user_job_postings_ordered_by_created_at_desc(db_session):
 
 
 @pytest.mark.asyncio
-async def test_get_user_job_postings_user_isolation(db_session):
+async def test_get_user_job_postings_user_isolation(db_session, test_user, other_user):
     """Test user can only see their own job postings."""
-    user1 = User(email="user6@test.com", hashed_password="hashed")
-    user2 = User(email="user7@test.com", hashed_password="hashed")
-    db_session.add_all([user1, user2])
-    await db_session.commit()
-    await db_session.refresh(user1)
-    await db_session.refresh(user2)
-
     # Create postings for both users
     await job_posting_service.create_job_posting(
         db=db_session,
-        user_id=user1.id,
+        user_id=test_user.id,
         title="User 1 Job",
         description="Description",
     )
     await job_posting_service.create_job_posting(
         db=db_session,
-        user_id=user2.id,
+        user_id=other_user.id,
         title="User 2 Job",
         description="Description",
     )
 
-    user1_postings = await job_posting_service.get_user_job_postings(db=db_session, user_id=user1.id)
+    user1_postings = await job_posting_service.get_user_job_postings(db=db_session, user_id=test_user.id)
 
     assert len(user1_postings) == 1
     assert user1_postings[0].title == "User 1 Job"
 
 
 @pytest.mark.asyncio
-async def test_get_job_posting_by_id_returns_posting(db_session):
+async def test_get_job_posting_by_id_returns_posting(db_session, test_user):
     """Test get_job_posting_by_id returns correct posting."""
-    user = User(email="user8@test.com", hashed_password="hashed")
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
     created = await job_posting_service.create_job_posting(
         db=db_session,
-        user_id=user.id,
+        user_id=test_user.id,
         title="Test Job",
         description="Description",
     )
 
     retrieved = await job_posting_service.get_job_posting_by_id(
-        db=db_session, job_posting_id=created.id, user_id=user.id
+        db=db_session, job_posting_id=created.id, user_id=test_user.id
     )
 
     assert retrieved is not None
@@ -184,58 +160,39 @@ async def test_get_job_posting_by_id_returns_posting(db_session):
 
 
 @pytest.mark.asyncio
-async def test_get_job_posting_by_id_wrong_user_raises_exception(db_session):
+async def test_get_job_posting_by_id_wrong_user_raises_exception(db_session, test_user, other_user):
     """Test get_job_posting_by_id raises exception for wrong user."""
-    user1 = User(email="user9@test.com", hashed_password="hashed")
-    user2 = User(email="user10@test.com", hashed_password="hashed")
-    db_session.add_all([user1, user2])
-    await db_session.commit()
-    await db_session.refresh(user1)
-    await db_session.refresh(user2)
-
     created = await job_posting_service.create_job_posting(
         db=db_session,
-        user_id=user1.id,
+        user_id=test_user.id,
         title="User 1 Job",
         description="Description",
     )
 
     # Try to get with wrong user - should raise exception
     with pytest.raises(JobPostingNotFoundException) as exc_info:
-        await job_posting_service.get_job_posting_by_id(db=db_session, job_posting_id=created.id, user_id=user2.id)
+        await job_posting_service.get_job_posting_by_id(db=db_session, job_posting_id=created.id, user_id=other_user.id)
 
     assert exc_info.value.status_code == 404
 
 
 @pytest.mark.asyncio
-async def test_get_job_posting_by_id_nonexistent_raises_exception(db_session):
+async def test_get_job_posting_by_id_nonexistent_raises_exception(db_session, test_user):
     """Test get_job_posting_by_id raises exception for non-existent posting."""
-    import uuid
-
-    user = User(email="user11@test.com", hashed_password="hashed")
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
     fake_id = uuid.uuid4()
 
     with pytest.raises(JobPostingNotFoundException) as exc_info:
-        await job_posting_service.get_job_posting_by_id(db=db_session, job_posting_id=fake_id, user_id=user.id)
+        await job_posting_service.get_job_posting_by_id(db=db_session, job_posting_id=fake_id, user_id=test_user.id)
 
     assert exc_info.value.status_code == 404
 
 
 @pytest.mark.asyncio
-async def test_update_job_posting_updates_fields(db_session):
+async def test_update_job_posting_updates_fields(db_session, test_user):
     """Test update_job_posting updates all fields."""
-    user = User(email="user12@test.com", hashed_password="hashed")
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
     created = await job_posting_service.create_job_posting(
         db=db_session,
-        user_id=user.id,
+        user_id=test_user.id,
         title="Original",
         description="Original description",
     )
@@ -244,7 +201,7 @@ async def test_update_job_posting_updates_fields(db_session):
     updated = await job_posting_service.update_job_posting(
         db=db_session,
         job_posting_id=created.id,
-        user_id=user.id,
+        user_id=test_user.id,
         title="Updated Title",
         description="Updated description",
         company="New Company",
@@ -261,22 +218,15 @@ async def test_update_job_posting_updates_fields(db_session):
 
 
 @pytest.mark.asyncio
-async def test_update_job_posting_not_found_raises_exception(db_session):
+async def test_update_job_posting_not_found_raises_exception(db_session, test_user):
     """Test update_job_posting raises exception for non-existent posting."""
-    import uuid
-
-    user = User(email="user13@test.com", hashed_password="hashed")
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
     fake_id = uuid.uuid4()
 
     with pytest.raises(JobPostingNotFoundException) as exc_info:
         await job_posting_service.update_job_posting(
             db=db_session,
             job_posting_id=fake_id,
-            user_id=user.id,
+            user_id=test_user.id,
             title="Test",
             description="Test",
         )
@@ -286,48 +236,36 @@ async def test_update_job_posting_not_found_raises_exception(db_session):
 
 
 @pytest.mark.asyncio
-async def test_delete_job_posting_deletes_successfully(db_session):
+async def test_delete_job_posting_deletes_successfully(db_session, test_user):
     """Test delete_job_posting removes posting from database."""
-    user = User(email="user14@test.com", hashed_password="hashed")
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
     created = await job_posting_service.create_job_posting(
         db=db_session,
-        user_id=user.id,
+        user_id=test_user.id,
         title="To Delete",
         description="Will be deleted",
     )
 
     # Verify exists
     retrieved = await job_posting_service.get_job_posting_by_id(
-        db=db_session, job_posting_id=created.id, user_id=user.id
+        db=db_session, job_posting_id=created.id, user_id=test_user.id
     )
     assert retrieved is not None
 
     # Delete
-    await job_posting_service.delete_job_posting(db=db_session, job_posting_id=created.id, user_id=user.id)
+    await job_posting_service.delete_job_posting(db=db_session, job_posting_id=created.id, user_id=test_user.id)
 
     # Verify deleted - should raise exception now
     with pytest.raises(JobPostingNotFoundException):
-        await job_posting_service.get_job_posting_by_id(db=db_session, job_posting_id=created.id, user_id=user.id)
+        await job_posting_service.get_job_posting_by_id(db=db_session, job_posting_id=created.id, user_id=test_user.id)
 
 
 @pytest.mark.asyncio
-async def test_delete_job_posting_not_found_raises_exception(db_session):
+async def test_delete_job_posting_not_found_raises_exception(db_session, test_user):
     """Test delete_job_posting raises exception for non-existent posting."""
-    import uuid
-
-    user = User(email="user15@test.com", hashed_password="hashed")
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
     fake_id = uuid.uuid4()
 
     with pytest.raises(JobPostingNotFoundException) as exc_info:
-        await job_posting_service.delete_job_posting(db=db_session, job_posting_id=fake_id, user_id=user.id)
+        await job_posting_service.delete_job_posting(db=db_session, job_posting_id=fake_id, user_id=test_user.id)
 
     assert exc_info.value.status_code == 404
     assert "not found" in str(exc_info.value.detail).lower()
@@ -7,6 +7,7 @@ from unittest.mock import Mock
 import httpx
 from openai import APIConnectionError, APIError
 from openai import RateLimitError as OpenAIRateLimitError
+import pytest
 
 from app.core.exceptions import (
     AuthenticationError,
@@ -22,38 +23,32 @@ def test_mask_secrets_masks_openai_style_keys():
     assert "***MASKED***" in mask_secrets("token=sk-1234567890abcdef")
 
 
-def test_classify_connection_error_as_network_error():
-    err = APIConnectionError(request=Mock())
-    classified = classify_openai_error(err)
-    assert isinstance(classified, NetworkError)
-
-
-def test_classify_auth_error():
-    api_err = APIError("Invalid", request=Mock(), body={"error": {"message": "Invalid"}})
-    api_err.status_code = 401
-
-    classified = classify_openai_error(api_err)
-    assert isinstance(classified, AuthenticationError)
-
-
-def test_classify_server_error():
-    api_err = APIError("Boom", request=Mock(), body={"error": {"message": "Boom"}})
-    api_err.status_code = 503
-
-    classified = classify_openai_error(api_err)
-    assert isinstance(classified, ServerError)
-
-
-def test_classify_quota_exceeded_from_body_code():
-    api_err = APIError(
-        "Quota",
-        request=Mock(),
-        body={"error": {"message": "Quota", "code": "insufficient_quota"}},
-    )
-    api_err.status_code = 429
-
-    classified = classify_openai_error(api_err)
-    assert isinstance(classified, QuotaExceededError)
+def _make_api_error(status_code: int | None, body: dict | None) -> Exception:
+    if status_code is None:
+        return APIConnectionError(request=Mock())
+
+    api_err = APIError(body["error"]["message"], request=Mock(), body=body)
+    api_err.status_code = status_code
+    return api_err
+
+
+@pytest.mark.parametrize(
+    "status_code,body,expected",
+    [
+        pytest.param(None, None, NetworkError, id="connection_error"),
+        pytest.param(401, {"error": {"message": "Invalid"}}, AuthenticationError, id="auth_error"),
+        pytest.param(503, {"error": {"message": "Boom"}}, ServerError, id="server_error"),
+        pytest.param(
+            429,
+            {"error": {"message": "Quota", "code": "insufficient_quota"}},
+            QuotaExceededError,
+            id="quota_from_body_code",
+        ),
+    ],
+)
+def test_classify_openai_error(status_code, body, expected):
+    classified = classify_openai_error(_make_api_error(status_code, body))
+    assert isinstance(classified, expected)
 
 
 def test_classify_quota_exceeded_when_openai_raises_rate_limit_error():
@@ -19,7 +19,6 @@ async def test_create_resume_success(db_session: AsyncSession):
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Create resume
     content = "# Professional Resume\nExperience: 10 years"
@@ -42,7 +41,6 @@ async def test_create_resume_duplicate_raises_conflict(db_session: AsyncSession)
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Create first resume
     await create_resume(db_session, user.id, "First resume content")
@@ -81,7 +79,6 @@ async def test_create_resume_with_large_content(db_session: AsyncSession):
     user = User(email="large-content-test@example.com", hashed_password="hashed_pw")
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Create large content (close to 50KB limit)
     large_content = "Professional Experience:\n" + ("Detail. " * 6000)
@@ -100,7 +97,6 @@ async def test_get_user_resume_returns_resume(db_session: AsyncSession):
     user = User(email="get-test@example.com", hashed_password="hashed_pw")
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Create resume
     created = await create_resume(db_session, user.id, "Test content")
@@ -121,7 +117,6 @@ async def test_get_user_resume_returns_none_when_missing(db_session: AsyncSessio
     user = User(email="no-resume@example.com", hashed_password="hashed_pw")
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Don't create resume
     result = await get_user_resume(db_session, user.id)
@@ -139,7 +134,6 @@ async def test_update_user_resume_updates_content_and_timestamp(
     user = User(email="update-test@example.com", hashed_password="hashed_pw")
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Create resume
     original = await create_resume(db_session, user.id, "Original content")
@@ -165,7 +159,6 @@ async def test_update_user_resume_raises_not_found(db_session: AsyncSession):
     user = User(email="no-resume-update@example.com", hashed_password="hashed_pw")
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Don't create resume, try to update
     with pytest.raises(ResumeNotFoundException) as exc_info:
@@ -182,7 +175,6 @@ async def test_delete_user_resume_removes_resume(db_session: AsyncSession):
     user = User(email="delete-test@example.com", hashed_password="hashed_pw")
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Create resume
     await create_resume(db_session, user.id, "To be deleted")
@@ -206,7 +198,6 @@ async def test_delete_user_resume_raises_not_found(db_session: AsyncSession):
     user = User(email="no-resume-delete@example.com", hashed_password="hashed_pw")
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     # Don't create resume, try to delete
     with pytest.raises(ResumeNotFoundException) as exc_info:
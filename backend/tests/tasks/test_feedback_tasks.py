@@ -48,7 +48,6 @@ async def test_feedback_task_rolls_back_and_marks_failed_on_integrity_error(
     operation = Operation(operation_type="feedback_analysis", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     # Simulate unique constraint / duplicate insert.
     integrity_error = IntegrityError("stmt", "params", Exception("duplicate"))
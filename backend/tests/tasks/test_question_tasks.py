@@ -42,13 +42,11 @@ async def test_question_task_creates_message(
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
 
     # Create operation
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     initial_question_number = session.current_question_number
 
@@ -100,12 +98,10 @@ async def test_question_task_updates_operation(
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
 
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     await generate_question_task(operation.id, session.id)
 
@@ -138,12 +134,10 @@ async def test_question_task_handles_generation_failure(
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
 
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     await generate_question_task(operation.id, session.id)
 
@@ -179,12 +173,10 @@ async def test_question_task_rolls_back_partial_state_on_db_failure(
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
 
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     # Simulate a DB failure during the atomic write (after objects are staged).
     with patch.object(db_session, "flush", side_effect=Exception("db flush failed")):
@@ -233,12 +225,10 @@ async def test_question_task_masks_sensitive_error_message_from_http_exception(
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
 
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     await generate_question_task(operation.id, session.id)
 
@@ -278,12 +268,10 @@ async def test_question_task_sets_user_friendly_message_for_invalid_api_key(
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
 
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     await generate_question_task(operation.id, session.id)
 
@@ -321,13 +309,11 @@ async def test_multiple_questions_create_separate_messages(
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
 
     # Generate first question
     operation1 = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation1)
     await db_session.commit()
-    await db_session.refresh(operation1)
 
     await generate_question_task(operation1.id, session.id)
 
@@ -335,7 +321,6 @@ async def test_multiple_questions_create_separate_messages(
     operation2 = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation2)
     await db_session.commit()
-    await db_session.refresh(operation2)
 
     await generate_question_task(operation2.id, session.id)
 
@@ -370,7 +355,6 @@ async def test_question_task_handles_nonexistent_session(mock_session_local, db_
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     await generate_question_task(operation.id, fake_session_id)
 
@@ -408,12 +392,10 @@ async def test_question_task_all_fields_populated(
     )
     db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
 
     operation = Operation(operation_type="question_generation", status="pending")
     db_session.add(operation)
     await db_session.commit()
-    await db_session.refresh(operation)
 
     await generate_question_task(operation.id, session.id)
 
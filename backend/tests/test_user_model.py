@@ -3,11 +3,11 @@ import datetime as dt
 import pytest
 from sqlalchemy.exc import IntegrityError
 
+from app.models.user import User
+
 
 @pytest.mark.asyncio
 async def test_user_email_unique_constraint_enforced(db_session):
-    from app.models.user import User
-
     user1 = User(email="unique@example.com", hashed_password="hashed")
     db_session.add(user1)
     await db_session.commit()
@@ -23,8 +23,6 @@ async def test_user_email_unique_constraint_enforced(db_session):
 
 @pytest.mark.asyncio
 async def test_user_timestamps_populated_and_timezone_aware(db_session):
-    from app.models.user import User
-
     user = User(email="ts@example.com", hashed_password="hashed")
     db_session.add(user)
     await db_session.commit()